@@ -0,0 +1,135 @@
+// Cluster throughput benchmark (autocannon-style, no extra dependencies).
+//
+// Starts server.js with CLUSTER_WORKERS = 1, 2, 4 ... up to the CPU count,
+// drives GET TARGET_PATH with CONNECTIONS keep-alive connections spread over
+// LOAD_THREADS load-generator threads for DURATION_MS, and prints req/s plus
+// the scaling factor relative to a single worker. Load threads share the
+// machine with the server, so lower LOAD_THREADS or run on a larger host if
+// the generator itself becomes the bottleneck.
+//
+// Usage: MONGODB_URI=mongodb://localhost:27017/todo-bench npm run bench:cluster
+
+import { spawn } from 'node:child_process';
+import http from 'node:http';
+import os from 'node:os';
+import { fileURLToPath } from 'node:url';
+import { Worker, isMainThread, parentPort, workerData } from 'node:worker_threads';
+
+const PORT = Number(process.env.BENCH_PORT || 5055);
+const TARGET_PATH = process.env.TARGET_PATH || '/health';
+const DURATION_MS = Number(process.env.DURATION_MS || 10_000);
+const CONNECTIONS = Number(process.env.CONNECTIONS || 128);
+const LOAD_THREADS = Number(process.env.LOAD_THREADS || Math.max(1, Math.floor(os.availableParallelism() / 2)));
+const MAX_WORKERS = Number(process.env.MAX_WORKERS || os.availableParallelism());
+
+// Load generator thread: keep `connections` requests in flight until the deadline
+const generateLoad = ({ port, path, connections, durationMs }) => {
+  const agent = new http.Agent({ keepAlive: true, maxSockets: connections });
+  const deadline = Date.now() + durationMs;
+  let completed = 0;
+  let errors = 0;
+  let open = connections;
+
+  const fire = () => {
+    if (Date.now() >= deadline) {
+      open -= 1;
+      if (open === 0) {
+        agent.destroy();
+        parentPort.postMessage({ completed, errors });
+      }
+      return;
+    }
+    http
+      .get({ port, path, agent }, (res) => {
+        res.resume();
+        res.on('end', () => {
+          if (res.statusCode === 200) completed += 1;
+          else errors += 1;
+          fire();
+        });
+      })
+      .on('error', () => {
+        errors += 1;
+        fire();
+      });
+  };
+
+  for (let i = 0; i < connections; i += 1) fire();
+};
+
+const waitForServer = async () => {
+  for (let attempt = 0; attempt < 100; attempt += 1) {
+    const ok = await new Promise((resolve) => {
+      http
+        .get({ port: PORT, path: '/health' }, (res) => {
+          res.resume();
+          resolve(res.statusCode === 200);
+        })
+        .on('error', () => resolve(false));
+    });
+    if (ok) return;
+    await new Promise((resolve) => setTimeout(resolve, 200));
+  }
+  throw new Error('Server did not become healthy');
+};
+
+const measure = async (workers) => {
+  const server = spawn(process.execPath, [fileURLToPath(new URL('../server.js', import.meta.url))], {
+    env: { ...process.env, PORT: String(PORT), CLUSTER_WORKERS: String(workers), NODE_ENV: 'production' },
+    stdio: 'ignore'
+  });
+
+  try {
+    await waitForServer();
+    // Give every worker time to start listening before measuring
+    await new Promise((resolve) => setTimeout(resolve, 1000));
+
+    const perThread = Math.ceil(CONNECTIONS / LOAD_THREADS);
+    const results = await Promise.all(
+      Array.from(
+        { length: LOAD_THREADS },
+        () =>
+          new Promise((resolve, reject) => {
+            const worker = new Worker(fileURLToPath(import.meta.url), {
+              workerData: { port: PORT, path: TARGET_PATH, connections: perThread, durationMs: DURATION_MS }
+            });
+            worker.once('message', resolve);
+            worker.once('error', reject);
+          })
+      )
+    );
+
+    const completed = results.reduce((sum, r) => sum + r.completed, 0);
+    const errors = results.reduce((sum, r) => sum + r.errors, 0);
+    return { rps: completed / (DURATION_MS / 1000), errors };
+  } finally {
+    server.kill('SIGTERM');
+    await new Promise((resolve) => server.once('exit', resolve));
+  }
+};
+
+const run = async () => {
+  const counts = [];
+  for (let n = 1; n < MAX_WORKERS; n *= 2) counts.push(n);
+  counts.push(MAX_WORKERS);
+
+  console.log(`GET ${TARGET_PATH}: ${CONNECTIONS} connections, ${LOAD_THREADS} load threads, ${DURATION_MS}ms per run\n`);
+  let baseline;
+  for (const workers of counts) {
+    const { rps, errors } = await measure(workers);
+    baseline ??= rps;
+    console.log(
+      `  ${String(workers).padStart(2)} workers  ${rps.toFixed(0).padStart(8)} req/s  ` +
+        `x${(rps / baseline).toFixed(2)} (ideal x${workers})  errors=${errors}`
+    );
+  }
+};
+
+if (isMainThread) {
+  run().catch((err) => {
+    console.error(err);
+    process.exit(1);
+  });
+} else {
+  generateLoad(workerData);
+}
@@ -0,0 +1,108 @@
+// Keyset pagination benchmark.
+//
+// Seeds a single user with TASK_COUNT tasks, then walks PAGES pages through
+// taskService.listTasks and reports p50/p99 latency for the first, middle and
+// last page windows. With keyset cursors those numbers should stay flat; the
+// `skip` baseline is printed alongside for comparison.
+//
+// Usage: MONGODB_URI=mongodb://localhost:27017/todo-bench npm run bench:pagination
+
+import { performance } from 'node:perf_hooks';
+import mongoose from 'mongoose';
+import { connectDatabase, disconnectDatabase } from '../src/config/database.js';
+import Task from '../src/models/Task.js';
+import { listTasks } from '../src/services/taskService.js';
+
+const TASK_COUNT = Number(process.env.TASK_COUNT || 50_000);
+const PAGE_SIZE = Number(process.env.PAGE_SIZE || 100);
+const PAGES = Number(process.env.PAGES || 500);
+const WINDOW = 50;
+
+const percentile = (samples, p) => {
+  const sorted = [...samples].sort((a, b) => a - b);
+  return sorted[Math.min(sorted.length - 1, Math.floor((p / 100) * sorted.length))];
+};
+
+const report = (label, timings) => {
+  const windows = {
+    [`pages 1-${WINDOW}`]: timings.slice(0, WINDOW),
+    middle: timings.slice(Math.floor(timings.length / 2) - WINDOW / 2, Math.floor(timings.length / 2) + WINDOW / 2),
+    [`pages ${timings.length - WINDOW + 1}-${timings.length}`]: timings.slice(-WINDOW)
+  };
+
+  console.log(`\n${label}`);
+  for (const [name, samples] of Object.entries(windows)) {
+    console.log(
+      `  ${name.padEnd(16)} p50=${percentile(samples, 50).toFixed(2)}ms  p99=${percentile(samples, 99).toFixed(2)}ms`
+    );
+  }
+};
+
+const seed = async (userId) => {
+  const batch = [];
+  const start = Date.now() - TASK_COUNT * 1000;
+  for (let i = 0; i < TASK_COUNT; i += 1) {
+    batch.push({
+      userId,
+      title: `Benchmark task ${i}`,
+      priority: ['low', 'medium', 'high'][i % 3],
+      isCompleted: i % 4 === 0,
+      createdAt: new Date(start + i * 1000)
+    });
+    if (batch.length === 5000) {
+      await Task.insertMany(batch.splice(0), { ordered: false, lean: true });
+    }
+  }
+  if (batch.length) {
+    await Task.insertMany(batch, { ordered: false, lean: true });
+  }
+};
+
+const walkKeyset = async (userId) => {
+  const timings = [];
+  let cursor;
+  for (let page = 0; page < PAGES; page += 1) {
+    const t0 = performance.now();
+    const result = await listTasks(userId, { limit: PAGE_SIZE, sortBy: 'createdAt', order: 'desc', cursor });
+    timings.push(performance.now() - t0);
+    cursor = result.nextCursor;
+    if (!cursor) break;
+  }
+  return timings;
+};
+
+const walkOffset = async (userId) => {
+  const timings = [];
+  for (let page = 0; page < PAGES; page += 1) {
+    const t0 = performance.now();
+    await Task.find({ userId })
+      .sort({ createdAt: -1, _id: -1 })
+      .skip(page * PAGE_SIZE)
+      .limit(PAGE_SIZE)
+      .lean();
+    timings.push(performance.now() - t0);
+  }
+  return timings;
+};
+
+const run = async () => {
+  await connectDatabase(process.env.MONGODB_URI);
+  await Task.syncIndexes();
+
+  const userId = new mongoose.Types.ObjectId();
+  console.log(`Seeding ${TASK_COUNT} tasks...`);
+  await seed(userId);
+
+  try {
+    report(`Keyset cursor (${PAGE_SIZE}/page)`, await walkKeyset(String(userId)));
+    report(`Offset skip/limit baseline (${PAGE_SIZE}/page)`, await walkOffset(userId));
+  } finally {
+    await Task.deleteMany({ userId });
+    await disconnectDatabase();
+  }
+};
+
+run().catch((err) => {
+  console.error(err);
+  process.exit(1);
+});
@@ -0,0 +1,110 @@
+// Search benchmark.
+//
+// Seeds TASK_COUNT tasks (default 1M) spread over USER_COUNT users with mixed
+// Korean/English text, then runs each query in QUERIES SAMPLES times for one
+// user through searchService.searchTasks (cache disabled) and reports p50/p99
+// next to a case-insensitive $regex scan baseline.
+//
+// Usage: MONGODB_URI=mongodb://localhost:27017/todo-bench npm run bench:search
+
+import { performance } from 'node:perf_hooks';
+import mongoose from 'mongoose';
+import { taskCache } from '../src/cache/index.js';
+import { connectDatabase, disconnectDatabase } from '../src/config/database.js';
+import Task from '../src/models/Task.js';
+import TaskFacet from '../src/models/TaskFacet.js';
+import { rebuildSearchIndex, searchTasks } from '../src/services/searchService.js';
+import { buildSearchTokens } from '../src/utils/searchTokens.js';
+
+const TASK_COUNT = Number(process.env.TASK_COUNT || 1_000_000);
+const USER_COUNT = Number(process.env.USER_COUNT || 100);
+const SAMPLES = Number(process.env.SAMPLES || 50);
+const QUERIES = ['회의록', '보고서 작성', 'deploy', 'review 회의', '장보기'];
+
+const WORDS = [
+  '주간', '회의록', '정리', '보고서', '작성', '프로젝트', '일정', '장보기', '운동', '독서',
+  'deploy', 'review', 'backend', 'frontend', 'meeting', 'invoice', 'refactor', 'design', 'release', 'budget'
+];
+const TAGS = ['업무', '개인', '공부', 'work', 'home', 'urgent'];
+const CATEGORIES = ['Work', 'Personal', '학습', '가족'];
+
+const pick = (list, i) => list[i % list.length];
+
+const percentile = (samples, p) => {
+  const sorted = [...samples].sort((a, b) => a - b);
+  return sorted[Math.min(sorted.length - 1, Math.floor((p / 100) * sorted.length))];
+};
+
+const time = async (fn) => {
+  const samples = [];
+  for (let i = 0; i < SAMPLES; i += 1) {
+    const t0 = performance.now();
+    await fn();
+    samples.push(performance.now() - t0);
+  }
+  return `p50=${percentile(samples, 50).toFixed(2)}ms  p99=${percentile(samples, 99).toFixed(2)}ms`;
+};
+
+const seed = async (userIds) => {
+  let batch = [];
+  for (let i = 0; i < TASK_COUNT; i += 1) {
+    const task = {
+      userId: userIds[i % userIds.length],
+      title: `${pick(WORDS, i)} ${pick(WORDS, i * 7 + 3)} ${pick(WORDS, i * 13 + 5)}`,
+      description: `${pick(WORDS, i * 3)} ${pick(WORDS, i * 11 + 1)}를 ${pick(WORDS, i * 17 + 2)} 합니다`,
+      tags: [pick(TAGS, i), pick(TAGS, i * 5 + 1)],
+      category: pick(CATEGORIES, i * 3 + 1),
+      isCompleted: i % 5 === 0
+    };
+    task.searchTokens = buildSearchTokens(task);
+    batch.push(task);
+    if (batch.length === 10_000) {
+      await Task.insertMany(batch, { ordered: false, lean: true });
+      batch = [];
+      process.stdout.write(`\r  ${i + 1}/${TASK_COUNT}`);
+    }
+  }
+  if (batch.length) await Task.insertMany(batch, { ordered: false, lean: true });
+  process.stdout.write('\n');
+};
+
+const escapeRegex = (text) => text.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+
+const run = async () => {
+  await connectDatabase(process.env.MONGODB_URI);
+  await Task.syncIndexes();
+  await TaskFacet.syncIndexes();
+  taskCache.enabled = false;
+
+  const userIds = Array.from({ length: USER_COUNT }, () => new mongoose.Types.ObjectId());
+  const [userId] = userIds;
+
+  try {
+    console.log(`Seeding ${TASK_COUNT} tasks for ${USER_COUNT} users...`);
+    await seed(userIds);
+    await rebuildSearchIndex(String(userId));
+
+    for (const q of QUERIES) {
+      const indexed = await time(() => searchTasks(String(userId), { q, page: 1, limit: 20 }));
+      const regex = new RegExp(escapeRegex(q), 'i');
+      const scan = await time(() =>
+        Task.find({
+          userId,
+          $or: [{ title: regex }, { description: regex }, { tags: regex }, { category: regex }]
+        })
+          .limit(20)
+          .lean()
+      );
+      console.log(`\n"${q}"\n  search index  ${indexed}\n  $regex scan   ${scan}`);
+    }
+  } finally {
+    await Task.deleteMany({ userId: { $in: userIds } });
+    await TaskFacet.deleteMany({ userId: { $in: userIds } });
+    await disconnectDatabase();
+  }
+};
+
+run().catch((err) => {
+  console.error(err);
+  process.exit(1);
+});
@@ -1,50 +1,56 @@
-import express from 'express';
-import cors from 'cors';
-import helmet from 'helmet';
-import dotenv from 'dotenv';
-
-// Load environment variables
-dotenv.config();
-
-const app = express();
-const PORT = process.env.PORT || 5000;
-
-// Middleware
-app.use(helmet());
-app.use(cors());
-app.use(express.json());
-app.use(express.urlencoded({ extended: true }));
-
-// Health check endpoint
-app.get('/health', (req, res) => {
-  res.status(200).json({
-    status: 'OK',
-    message: 'To-Do Backend is running',
-    timestamp: new Date().toISOString()
-  });
-});
+import cluster from 'node:cluster';
+import { env } from './src/config/env.js';
 
-// Root endpoint
-app.get('/', (req, res) => {
-  res.json({
-    message: 'Welcome to To-Do List API',
-    version: '1.0.0'
-  });
-});
+const PORT = env.port;
 
-// Error handling middleware
-app.use((err, req, res, next) => {
-  console.error(err.stack);
-  res.status(500).json({
-    error: 'Something went wrong!',
-    message: process.env.NODE_ENV === 'development' ? err.message : undefined
+// Start a single server process: standalone, or as one cluster worker
+const startServer = async () => {
+  const [{ default: app }, { connectDatabase, disconnectDatabase }, { processState }] = await Promise.all([
+    import('./src/app.js'),
+    import('./src/config/database.js'),
+    import('./src/utils/processState.js')
+  ]);
+
+  await connectDatabase();
+
+  const server = app.listen(PORT, () => {
+    const role = cluster.isWorker ? `Worker ${cluster.worker.id} (pid ${process.pid})` : 'Server';
+    console.log(`🚀 ${role} is running on port ${PORT}`);
+    console.log(`📍 Health check: http://localhost:${PORT}/health`);
   });
-});
 
-// Start server
-app.listen(PORT, () => {
-  console.log(`🚀 Server is running on port ${PORT}`);
-  console.log(`📍 Health check: http://localhost:${PORT}/health`);
+  // Graceful drain: stop accepting connections, let in-flight requests
+  // finish (bounded by SHUTDOWN_TIMEOUT_MS), then close the database pool.
+  const shutdown = (signal) => {
+    if (processState.draining) return;
+    processState.draining = true;
+    console.log(`🛑 ${signal} received, draining ${processState.inFlight} in-flight requests`);
+
+    setTimeout(() => {
+      console.error('Drain timed out, forcing exit');
+      process.exit(1);
+    }, env.shutdownTimeoutMs).unref();
+
+    server.close(async () => {
+      await disconnectDatabase();
+      process.exit(0);
+    });
+  };
+
+  process.on('SIGTERM', () => shutdown('SIGTERM'));
+  process.on('SIGINT', () => shutdown('SIGINT'));
+};
+
+const start = async () => {
+  if (env.clusterWorkers > 1 && cluster.isPrimary) {
+    const { startPrimary } = await import('./src/cluster.js');
+    startPrimary({ workers: env.clusterWorkers, shutdownTimeoutMs: env.shutdownTimeoutMs });
+    return;
+  }
+  await startServer();
+};
+
+start().catch((err) => {
+  console.error('Failed to start server:', err);
+  process.exit(1);
 });
-
-export default app;
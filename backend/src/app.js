@@ -0,0 +1,78 @@
+import express from 'express';
+import cors from 'cors';
+import helmet from 'helmet';
+import mongoose from 'mongoose';
+import { env } from './config/env.js';
+import { registry } from './config/metrics.js';
+import { errorHandler, notFound } from './middleware/errorHandler.js';
+import { requestMetrics } from './middleware/requestMetrics.js';
+import authRoutes from './routes/authRoutes.js';
+import syncRoutes from './routes/syncRoutes.js';
+import taskRoutes from './routes/taskRoutes.js';
+import { ApiError } from './utils/ApiError.js';
+import { EXPOSITION_CONTENT_TYPE } from './utils/metrics.js';
+import { processState, trackRequests } from './utils/processState.js';
+import { MAX_BULK_BODY_BYTES } from './validators/taskSchemas.js';
+
+const app = express();
+
+// Middleware
+app.use(requestMetrics);
+app.use(trackRequests);
+app.use(helmet());
+app.use(cors({ origin: env.corsOrigin }));
+// Bulk writes carry up to MAX_BULK_OPERATIONS full tasks; every other route
+// keeps body-parser's default limit
+app.use('/api/tasks/bulk', express.json({ limit: MAX_BULK_BODY_BYTES }));
+app.use(express.json());
+app.use(express.urlencoded({ extended: true }));
+
+const DB_STATES = ['disconnected', 'connected', 'connecting', 'disconnecting'];
+
+// Health check endpoint. Reports on the worker that served the request and
+// returns 503 while it drains so load balancers stop routing to it.
+app.get('/health', (req, res) => {
+  const { heapUsed, rss } = process.memoryUsage();
+  res.status(processState.draining ? 503 : 200).json({
+    status: processState.draining ? 'DRAINING' : 'OK',
+    message: 'To-Do Backend is running',
+    timestamp: new Date().toISOString(),
+    worker: {
+      id: processState.workerId,
+      pid: process.pid,
+      uptimeSeconds: Math.round((Date.now() - processState.startedAt) / 1000),
+      inFlight: processState.inFlight,
+      heapUsedBytes: heapUsed,
+      rssBytes: rss,
+      database: DB_STATES[mongoose.connection.readyState] ?? 'unknown'
+    }
+  });
+});
+
+// Prometheus scrape endpoint (per worker in cluster mode). Set METRICS_TOKEN
+// to require `Authorization: Bearer <token>`.
+app.get('/metrics', (req, res) => {
+  if (env.metricsToken && req.headers.authorization !== `Bearer ${env.metricsToken}`) {
+    throw ApiError.unauthorized();
+  }
+  res.type(EXPOSITION_CONTENT_TYPE).send(registry.render());
+});
+
+// Root endpoint
+app.get('/', (req, res) => {
+  res.json({
+    message: 'Welcome to To-Do List API',
+    version: '1.0.0'
+  });
+});
+
+// API routes
+app.use('/api/auth', authRoutes);
+app.use('/api/tasks', taskRoutes);
+app.use('/api/sync', syncRoutes);
+
+// Error handling middleware
+app.use(notFound);
+app.use(errorHandler);
+
+export default app;
@@ -0,0 +1,45 @@
+// In-process cache store with bounded LRU eviction and per-entry TTLs.
+//
+// Every store (this one, or a shared one such as Redis added later) exposes the
+// same async interface:
+//   get(key)               -> value | undefined
+//   set(key, value, ttlMs) -> void   (ttlMs omitted = no expiry)
+//   delete(key)            -> void
+export class MemoryStore {
+  constructor({ maxEntries = 5000 } = {}) {
+    this.maxEntries = maxEntries;
+    this.entries = new Map();
+  }
+
+  async get(key) {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+
+    if (entry.expiresAt !== null && entry.expiresAt <= Date.now()) {
+      this.entries.delete(key);
+      return undefined;
+    }
+
+    // Map keeps insertion order, so re-inserting marks the key most recently used
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  async set(key, value, ttlMs) {
+    this.entries.delete(key);
+    this.entries.set(key, { value, expiresAt: ttlMs ? Date.now() + ttlMs : null });
+
+    while (this.entries.size > this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value);
+    }
+  }
+
+  async delete(key) {
+    this.entries.delete(key);
+  }
+
+  get size() {
+    return this.entries.size;
+  }
+}
@@ -0,0 +1,86 @@
+import { randomUUID } from 'node:crypto';
+
+// IPC message type used to relay invalidations between cluster workers
+export const INVALIDATE_MESSAGE = 'cache:invalidate';
+
+// Normalize a query object into a stable key: drop undefined values and sort keys
+const normalize = (query = {}) =>
+  JSON.stringify(
+    Object.keys(query)
+      .filter((key) => query[key] !== undefined)
+      .sort()
+      .map((key) => [key, query[key]])
+  );
+
+// Per-user read-through cache.
+//
+// Each user has a version stamp stored alongside the cached entries, and every
+// entry key embeds the stamp it was computed under. Invalidation replaces the
+// stamp with a fresh random one, which orphans all of that user's entries at
+// once; they age out through LRU/TTL. Random stamps (rather than a counter)
+// stay correct when the stamp itself is evicted or lives in a shared store.
+export class QueryCache {
+  constructor(store, { namespace, ttlMs, enabled = true, onInvalidate }) {
+    this.store = store;
+    this.namespace = namespace;
+    this.ttlMs = ttlMs;
+    this.enabled = enabled;
+    this.onInvalidate = onInvalidate;
+    this.inflight = new Map();
+    this.stamping = new Map();
+  }
+
+  versionKey(userId) {
+    return `${this.namespace}:v:${userId}`;
+  }
+
+  async version(userId) {
+    const key = this.versionKey(userId);
+    const stamp = await this.store.get(key);
+    if (stamp !== undefined) return stamp;
+
+    // Concurrent first requests must agree on one stamp, or each would key
+    // its result under a different one and the shared load would be missed
+    if (!this.stamping.has(key)) {
+      const fresh = randomUUID();
+      const pending = this.store
+        .set(key, fresh)
+        .then(() => fresh)
+        .finally(() => this.stamping.delete(key));
+      this.stamping.set(key, pending);
+    }
+    return this.stamping.get(key);
+  }
+
+  // Return the cached value for (userId, kind, query) or compute and store it.
+  // Concurrent misses for the same key share a single load.
+  async wrap(userId, kind, query, load) {
+    if (!this.enabled) return load();
+
+    const key = `${this.namespace}:${userId}:${await this.version(userId)}:${kind}:${normalize(query)}`;
+    const cached = await this.store.get(key);
+    if (cached !== undefined) return cached;
+
+    if (this.inflight.has(key)) return this.inflight.get(key);
+
+    const pending = (async () => {
+      try {
+        const value = await load();
+        await this.store.set(key, value, this.ttlMs);
+        return value;
+      } finally {
+        this.inflight.delete(key);
+      }
+    })();
+    this.inflight.set(key, pending);
+    return pending;
+  }
+
+  // `onInvalidate` tells other processes sharing this cache's data; it is
+  // skipped when applying an invalidation received from one of them.
+  async invalidate(userId, { propagate = true } = {}) {
+    if (!this.enabled) return;
+    await this.store.set(this.versionKey(userId), randomUUID());
+    if (propagate) this.onInvalidate?.(userId);
+  }
+}
@@ -0,0 +1,55 @@
+import cluster from 'node:cluster';
+import { env } from '../config/env.js';
+import { MemoryStore } from './MemoryStore.js';
+import { INVALIDATE_MESSAGE, QueryCache } from './QueryCache.js';
+
+export { MemoryStore } from './MemoryStore.js';
+export { INVALIDATE_MESSAGE, QueryCache } from './QueryCache.js';
+
+const stores = {
+  memory: () => new MemoryStore({ maxEntries: env.cacheMaxEntries })
+};
+
+export const createStore = (driver = env.cacheDriver) => {
+  const factory = stores[driver];
+  if (!factory) {
+    throw new Error(`Unknown CACHE_DRIVER "${driver}" (expected one of: ${Object.keys(stores).join(', ')})`);
+  }
+  return factory();
+};
+
+// Drivers whose data lives in this process only
+const LOCAL_DRIVERS = new Set(['memory']);
+
+// In cluster mode each worker has its own in-memory store, so an
+// invalidation is sent to the primary, which relays it to every other worker
+// (see cluster.js). Without this, other workers would keep serving results
+// from before the write until CACHE_TTL_MS.
+const relayInvalidation = (namespace) =>
+  cluster.isWorker && LOCAL_DRIVERS.has(env.cacheDriver)
+    ? (userId) => {
+        if (process.connected) process.send({ type: INVALIDATE_MESSAGE, namespace, userId });
+      }
+    : undefined;
+
+const caches = new Map();
+const createCache = (namespace) => {
+  const cache = new QueryCache(createStore(), {
+    namespace,
+    ttlMs: env.cacheTtlMs,
+    enabled: env.cacheEnabled,
+    onInvalidate: relayInvalidation(namespace)
+  });
+  caches.set(namespace, cache);
+  return cache;
+};
+
+if (cluster.isWorker) {
+  process.on('message', (message) => {
+    if (message?.type !== INVALIDATE_MESSAGE) return;
+    caches.get(message.namespace)?.invalidate(message.userId, { propagate: false });
+  });
+}
+
+// Cache in front of taskService read paths
+export const taskCache = createCache('tasks');
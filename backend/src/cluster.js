@@ -0,0 +1,138 @@
+import cluster from 'node:cluster';
+import { INVALIDATE_MESSAGE } from './cache/QueryCache.js';
+
+// A worker that exits before it has been listening this long counts as a
+// failed start; repeated failed starts are retried with exponential backoff.
+const MIN_HEALTHY_UPTIME_MS = 10_000;
+const MAX_RESTART_DELAY_MS = 30_000;
+
+// Resolves once `worker` is listening; rejects if it exits first or takes
+// longer than `timeoutMs`.
+const whenListening = (worker, timeoutMs) =>
+  new Promise((resolve, reject) => {
+    const cleanup = () => {
+      clearTimeout(timer);
+      worker.off('listening', onListening);
+      worker.off('exit', onExit);
+    };
+    const onListening = () => {
+      cleanup();
+      resolve();
+    };
+    const onExit = (code, signal) => {
+      cleanup();
+      reject(new Error(`worker ${worker.id} exited (${signal || code}) before listening`));
+    };
+    const timer = setTimeout(() => {
+      cleanup();
+      reject(new Error(`worker ${worker.id} was not listening after ${timeoutMs} ms`));
+    }, timeoutMs);
+
+    worker.once('listening', onListening);
+    worker.once('exit', onExit);
+  });
+
+// Primary process for cluster mode: forks one worker per CPU (or
+// CLUSTER_WORKERS), replaces crashed workers, rolls workers one at a time on
+// SIGHUP and drains all of them on SIGTERM/SIGINT.
+export const startPrimary = ({ workers, shutdownTimeoutMs, startTimeoutMs = 30_000 }) => {
+  let shuttingDown = false;
+  let failedStarts = 0;
+  const retiring = new Set();
+  // Rolling-restart replacements are supervised by rollingRestart itself
+  const replacing = new Set();
+  const listeningSince = new Map();
+
+  const fork = () => {
+    const worker = cluster.fork();
+    worker.once('listening', () => listeningSince.set(worker.id, Date.now()));
+    return worker;
+  };
+
+  cluster.on('exit', (worker, code, signal) => {
+    const since = listeningSince.get(worker.id);
+    listeningSince.delete(worker.id);
+    if (retiring.delete(worker.id) || replacing.has(worker.id) || shuttingDown) return;
+
+    // Crash loops (e.g. MongoDB unreachable at startup) back off instead of
+    // forking as fast as workers can fail
+    failedStarts = since === undefined || Date.now() - since < MIN_HEALTHY_UPTIME_MS ? failedStarts + 1 : 0;
+    const delay = failedStarts ? Math.min(MAX_RESTART_DELAY_MS, 1000 * 2 ** (failedStarts - 1)) : 0;
+    console.warn(
+      `⚠️  Worker ${worker.id} (pid ${worker.process.pid}) died (${signal || code}), restarting in ${delay} ms`
+    );
+    setTimeout(() => {
+      if (!shuttingDown) fork();
+    }, delay);
+  });
+
+  // Relay query-cache invalidations to every other worker (see cache/index.js)
+  cluster.on('message', (sender, message) => {
+    if (message?.type !== INVALIDATE_MESSAGE) return;
+    for (const worker of Object.values(cluster.workers)) {
+      if (worker !== sender && worker.isConnected()) worker.send(message);
+    }
+  });
+
+  // Resolves once `worker` has exited; a worker that is already dead (e.g. it
+  // crashed during a rolling restart) has nothing left to wait for
+  const retire = (worker) =>
+    new Promise((resolve) => {
+      if (worker.isDead()) {
+        resolve();
+        return;
+      }
+      retiring.add(worker.id);
+      worker.once('exit', resolve);
+      worker.process.kill('SIGTERM');
+    });
+
+  // Zero-downtime restart: each replacement must be listening before the
+  // worker it replaces is asked to drain. A replacement that dies or does not
+  // come up in time aborts the restart and leaves the remaining workers as
+  // they are.
+  const rollingRestart = async () => {
+    console.log('🔄 Rolling restart of all workers');
+    for (const worker of Object.values(cluster.workers)) {
+      if (shuttingDown) return;
+      // Crashed since the restart began: the exit handler already replaced it
+      if (worker.isDead()) continue;
+      const replacement = fork();
+      replacing.add(replacement.id);
+      try {
+        await whenListening(replacement, startTimeoutMs);
+      } catch (err) {
+        console.error(`❌ Rolling restart aborted: ${err.message}`);
+        if (!replacement.isDead()) await retire(replacement);
+        return;
+      } finally {
+        replacing.delete(replacement.id);
+      }
+      await retire(worker);
+    }
+    console.log('✅ Rolling restart complete');
+  };
+
+  const shutdown = async (signal) => {
+    if (shuttingDown) return;
+    shuttingDown = true;
+    console.log(`🛑 ${signal} received, draining ${Object.keys(cluster.workers).length} workers`);
+
+    // Workers enforce their own drain timeout; this is a last-resort backstop
+    setTimeout(() => process.exit(1), shutdownTimeoutMs + 5000).unref();
+    await Promise.all(Object.values(cluster.workers).map(retire));
+    process.exit(0);
+  };
+
+  let restarting = null;
+  process.on('SIGHUP', () => {
+    restarting ??= rollingRestart().finally(() => {
+      restarting = null;
+    });
+  });
+  process.on('SIGTERM', () => shutdown('SIGTERM'));
+  process.on('SIGINT', () => shutdown('SIGINT'));
+
+  console.log(`🧩 Cluster primary ${process.pid} starting ${workers} workers`);
+  for (let i = 0; i < workers; i += 1) fork();
+};
@@ -0,0 +1,16 @@
+import mongoose from 'mongoose';
+import { instrumentMongoClient } from '../utils/mongoMetrics.js';
+import { env } from './env.js';
+
+// Connect to MongoDB with a bounded connection pool and command timing
+export const connectDatabase = async (uri = env.mongodbUri) => {
+  await mongoose.connect(uri, {
+    maxPoolSize: env.mongoMaxPoolSize,
+    monitorCommands: true
+  });
+  instrumentMongoClient(mongoose.connection.getClient());
+  console.log(`🍃 MongoDB connected: ${mongoose.connection.host}`);
+  return mongoose.connection;
+};
+
+export const disconnectDatabase = () => mongoose.disconnect();
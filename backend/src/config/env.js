@@ -0,0 +1,38 @@
+import os from 'node:os';
+import dotenv from 'dotenv';
+
+// Load environment variables before anything reads process.env
+dotenv.config();
+
+const toInt = (value, fallback) => {
+  const parsed = Number.parseInt(value, 10);
+  return Number.isNaN(parsed) ? fallback : parsed;
+};
+
+// CLUSTER_WORKERS: unset/1 = single process, "auto" = one worker per CPU
+const clusterWorkers = (value) => (value === 'auto' ? os.availableParallelism() : toInt(value, 1));
+
+export const env = {
+  nodeEnv: process.env.NODE_ENV || 'development',
+  port: toInt(process.env.PORT, 5000),
+  clusterWorkers: clusterWorkers(process.env.CLUSTER_WORKERS),
+  shutdownTimeoutMs: toInt(process.env.SHUTDOWN_TIMEOUT_MS, 15_000),
+  mongodbUri: process.env.MONGODB_URI || 'mongodb://localhost:27017/todo-app',
+  mongoMaxPoolSize: toInt(process.env.MONGODB_MAX_POOL_SIZE, 20),
+  jwtSecret: process.env.JWT_SECRET,
+  jwtExpire: process.env.JWT_EXPIRE || '7d',
+  tokenCacheMaxEntries: toInt(process.env.TOKEN_CACHE_MAX_ENTRIES, 10_000),
+  tokenCacheTtlMs: toInt(process.env.TOKEN_CACHE_TTL_MS, 5 * 60_000),
+  bcryptCost: toInt(process.env.BCRYPT_COST, 10),
+  bcryptPoolSize: toInt(process.env.BCRYPT_POOL_SIZE, Math.max(1, Math.min(4, os.availableParallelism() - 1))),
+  bcryptMaxQueue: toInt(process.env.BCRYPT_MAX_QUEUE, 200),
+  corsOrigin: process.env.CORS_ORIGIN || '*',
+  slowQueryMs: toInt(process.env.SLOW_QUERY_MS, 100),
+  metricsToken: process.env.METRICS_TOKEN || '',
+  cacheEnabled: process.env.CACHE_ENABLED !== 'false',
+  cacheDriver: process.env.CACHE_DRIVER || 'memory',
+  cacheMaxEntries: toInt(process.env.CACHE_MAX_ENTRIES, 5000),
+  cacheTtlMs: toInt(process.env.CACHE_TTL_MS, 30_000)
+};
+
+export const isDevelopment = env.nodeEnv === 'development';
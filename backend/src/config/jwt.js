@@ -0,0 +1,6 @@
+import { env } from './env.js';
+
+export const jwtConfig = {
+  secret: env.jwtSecret,
+  expiresIn: env.jwtExpire
+};
@@ -0,0 +1,58 @@
+import { monitorEventLoopDelay } from 'node:perf_hooks';
+import { Counter, Gauge, Histogram, Registry } from '../utils/metrics.js';
+import { processState } from '../utils/processState.js';
+
+const LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10];
+const NS_PER_SECOND = 1e9;
+
+// Every series carries the cluster worker id (0 in single-process mode)
+export const registry = new Registry({ worker: processState.workerId });
+
+export const httpRequestDuration = registry.register(
+  new Histogram('http_request_duration_seconds', 'HTTP request latency by route', LATENCY_BUCKETS)
+);
+
+registry.register(
+  new Gauge('http_requests_in_flight', 'HTTP requests currently being served', () => [{ value: processState.inFlight }])
+);
+
+export const mongoCommandDuration = registry.register(
+  new Histogram('mongodb_command_duration_seconds', 'MongoDB command latency by collection and command', LATENCY_BUCKETS)
+);
+
+export const mongoSlowCommands = registry.register(
+  new Counter('mongodb_slow_commands_total', 'MongoDB commands slower than SLOW_QUERY_MS')
+);
+
+// Event-loop delay since the previous scrape. The monitor samples with a
+// timer of `resolution` ms, and every sample includes that interval, so it
+// is subtracted to leave only the lag (an idle loop reports ~0, not ~20 ms).
+const EVENT_LOOP_RESOLUTION_MS = 20;
+const eventLoopDelay = monitorEventLoopDelay({ resolution: EVENT_LOOP_RESOLUTION_MS });
+eventLoopDelay.enable();
+
+const lagSeconds = (delayNs) => Math.max(0, delayNs / NS_PER_SECOND - EVENT_LOOP_RESOLUTION_MS / 1000);
+
+registry.register(
+  new Gauge('nodejs_eventloop_lag_seconds', 'Event-loop delay since the last scrape', () => {
+    const samples = [
+      { labels: { quantile: '0.5' }, value: lagSeconds(eventLoopDelay.percentile(50)) },
+      { labels: { quantile: '0.99' }, value: lagSeconds(eventLoopDelay.percentile(99)) },
+      { labels: { quantile: '1' }, value: lagSeconds(eventLoopDelay.max) }
+    ];
+    eventLoopDelay.reset();
+    return samples;
+  })
+);
+
+registry.register(
+  new Gauge('nodejs_heap_used_bytes', 'V8 heap in use', () => [{ value: process.memoryUsage().heapUsed }])
+);
+
+registry.register(
+  new Gauge('nodejs_heap_total_bytes', 'V8 heap allocated', () => [{ value: process.memoryUsage().heapTotal }])
+);
+
+registry.register(
+  new Gauge('process_resident_memory_bytes', 'Resident set size', () => [{ value: process.memoryUsage().rss }])
+);
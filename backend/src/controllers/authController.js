@@ -0,0 +1,13 @@
+import * as authService from '../services/authService.js';
+
+// POST /api/auth/signup
+export const signup = async (req, res) => {
+  const { user, token } = await authService.signup(req.validated.body);
+  res.status(201).json({ user, token });
+};
+
+// POST /api/auth/login
+export const login = async (req, res) => {
+  const { user, token } = await authService.login(req.validated.body);
+  res.json({ user, token });
+};
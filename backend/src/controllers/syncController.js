@@ -0,0 +1,6 @@
+import { getChanges } from '../services/syncService.js';
+
+// GET /api/sync
+export const getSync = async (req, res) => {
+  res.json(await getChanges(req.user.id, req.validated.query));
+};
@@ -0,0 +1,61 @@
+import { searchTasks } from '../services/searchService.js';
+import { bulkMutateTasks, getTaskCounts, listTasks, streamTasks } from '../services/taskService.js';
+
+const NDJSON = 'application/x-ndjson';
+
+const wantsStream = (req) => req.validated.query.stream || req.accepts(['json', NDJSON]) === NDJSON;
+
+// Resolves once the response can take more data or the client has gone away
+const writable = (res) =>
+  new Promise((resolve) => {
+    const done = () => {
+      res.off('drain', done);
+      res.off('close', done);
+      resolve();
+    };
+    res.once('drain', done);
+    res.once('close', done);
+  });
+
+// GET /api/tasks
+export const getTasks = async (req, res) => {
+  const options = req.validated.query;
+
+  if (!wantsStream(req)) {
+    const { tasks, nextCursor } = await listTasks(req.user.id, options);
+    return res.json({ tasks, nextCursor });
+  }
+
+  // Large pages are written as newline-delimited JSON so memory stays flat
+  // and the client can render rows as they arrive.
+  res.status(200).type(NDJSON);
+  for await (const item of streamTasks(req.user.id, options)) {
+    const line = `${JSON.stringify(item.task ?? { nextCursor: item.nextCursor })}\n`;
+    if (!res.write(line) && !res.destroyed) {
+      await writable(res);
+    }
+    // Leaving the loop on disconnect runs streamTasks' finally, which closes the cursor
+    if (res.destroyed || res.writableEnded) {
+      break;
+    }
+  }
+  if (!res.destroyed && !res.writableEnded) {
+    res.end();
+  }
+};
+
+// GET /api/tasks/counts
+export const getCounts = async (req, res) => {
+  res.json(await getTaskCounts(req.user.id));
+};
+
+// GET /api/tasks/search
+export const search = async (req, res) => {
+  res.json(await searchTasks(req.user.id, req.validated.query));
+};
+
+// POST /api/tasks/bulk
+export const bulkTasks = async (req, res) => {
+  const { results, summary } = await bulkMutateTasks(req.user.id, req.validated.body.operations);
+  res.status(200).json({ results, summary });
+};
@@ -0,0 +1,46 @@
+import { createHash } from 'node:crypto';
+import jwt from 'jsonwebtoken';
+import { MemoryStore } from '../cache/MemoryStore.js';
+import { env } from '../config/env.js';
+import { jwtConfig } from '../config/jwt.js';
+import { ApiError } from '../utils/ApiError.js';
+
+// Verified claims are cached per process, keyed by a hash of the token so raw
+// tokens are never held in memory. An entry never outlives the token's own
+// `exp`, so an expired token is always re-verified (and rejected).
+const verifiedTokens = new MemoryStore({ maxEntries: env.tokenCacheMaxEntries });
+
+const tokenKey = (token) => createHash('sha256').update(token).digest('base64url');
+
+const verifyToken = async (token) => {
+  const key = tokenKey(token);
+  const cached = await verifiedTokens.get(key);
+  if (cached) return cached;
+
+  const claims = jwt.verify(token, jwtConfig.secret);
+  const ttlMs = claims.exp ? Math.min(claims.exp * 1000 - Date.now(), env.tokenCacheTtlMs) : env.tokenCacheTtlMs;
+  if (ttlMs > 0) {
+    await verifiedTokens.set(key, claims, ttlMs);
+  }
+  return claims;
+};
+
+// Verify the Bearer JWT and attach the authenticated user to req.user
+export const protect = async (req, res, next) => {
+  const header = req.headers.authorization || '';
+  const [scheme, token] = header.split(' ');
+
+  if (scheme !== 'Bearer' || !token) {
+    return next(ApiError.unauthorized('Missing bearer token'));
+  }
+
+  let claims;
+  try {
+    claims = await verifyToken(token);
+  } catch {
+    return next(ApiError.unauthorized('Invalid or expired token'));
+  }
+
+  req.user = { id: claims.id };
+  next();
+};
@@ -0,0 +1,33 @@
+import { isDevelopment } from '../config/env.js';
+import { ApiError } from '../utils/ApiError.js';
+
+// 404 for unmatched routes
+export const notFound = (req, res, next) => {
+  next(ApiError.notFound(`Route not found: ${req.method} ${req.originalUrl}`));
+};
+
+// Error handling middleware
+export const errorHandler = (err, req, res, next) => {
+  if (res.headersSent) {
+    return next(err);
+  }
+
+  if (err instanceof ApiError) {
+    return res.status(err.statusCode).json({
+      error: err.message,
+      details: err.details
+    });
+  }
+
+  // Client errors raised by middleware such as body-parser (malformed JSON,
+  // payload too large) carry their own status and a safe message
+  if (err.expose && err.status) {
+    return res.status(err.status).json({ error: err.message });
+  }
+
+  console.error(err.stack);
+  res.status(500).json({
+    error: 'Something went wrong!',
+    message: isDevelopment ? err.message : undefined
+  });
+};
@@ -0,0 +1,48 @@
+import { performance } from 'node:perf_hooks';
+import { httpRequestDuration } from '../config/metrics.js';
+import { requestContext } from '../utils/requestContext.js';
+
+// Matched route template (e.g. /api/tasks/search) rather than the raw URL,
+// so label cardinality stays bounded. Requests that stop inside a router
+// before reaching a route (e.g. a 401 from `protect`) get `<mount path>/*`.
+const routeLabel = (req, mountPath = req.baseUrl) => {
+  if (req.route) return `${mountPath}${req.route.path}`;
+  return mountPath ? `${mountPath}/*` : 'unmatched';
+};
+
+// First middleware of every router. Express restores req.baseUrl before an
+// error reaches the app-level error handler, so the mount path is recorded
+// while it is still known.
+export const recordMountPath = (req, res, next) => {
+  const timing = requestContext.getStore();
+  if (timing) timing.mountPath = req.baseUrl;
+  next();
+};
+
+// Record per-route latency and add a Server-Timing header with total app
+// time plus the MongoDB time and command count spent on this request.
+export const requestMetrics = (req, res, next) => {
+  const start = performance.now();
+  const timing = { dbMs: 0, dbCount: 0, mountPath: undefined, route: undefined, request: `${req.method} ${req.path}` };
+
+  const writeHead = res.writeHead;
+  res.writeHead = function writeHeadWithTiming(...args) {
+    // The route is only known while the handler runs, so capture it here
+    timing.route = routeLabel(req, timing.mountPath);
+    const appMs = performance.now() - start;
+    this.setHeader(
+      'Server-Timing',
+      `app;dur=${appMs.toFixed(1)}, db;dur=${timing.dbMs.toFixed(1)};desc="${timing.dbCount} queries"`
+    );
+    return writeHead.apply(this, args);
+  };
+
+  res.once('finish', () => {
+    httpRequestDuration.observe(
+      { method: req.method, route: timing.route ?? routeLabel(req, timing.mountPath), status: res.statusCode },
+      (performance.now() - start) / 1000
+    );
+  });
+
+  requestContext.run(timing, next);
+};
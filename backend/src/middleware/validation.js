@@ -0,0 +1,19 @@
+import { ApiError } from '../utils/ApiError.js';
+
+// Validate req[source] against a Joi schema.
+// Express 5 exposes req.query as a read-only getter, so validated values
+// are published on req.validated[source] instead of overwriting the original.
+export const validate = (schema, source = 'body') => (req, res, next) => {
+  const { value, error } = schema.validate(req[source] ?? {}, {
+    abortEarly: false,
+    stripUnknown: true,
+    convert: true
+  });
+
+  if (error) {
+    return next(ApiError.badRequest('Validation failed', error.details.map((d) => d.message)));
+  }
+
+  req.validated = { ...req.validated, [source]: value };
+  next();
+};
@@ -0,0 +1,19 @@
+import mongoose from 'mongoose';
+
+const { Schema } = mongoose;
+
+// Per-user sync clock. `version` is bumped once per task write batch;
+// `pending` lists versions whose writes have not finished yet, so readers
+// never advance past a batch that is still being written.
+const syncStateSchema = new Schema(
+  {
+    userId: { type: Schema.Types.ObjectId, ref: 'User', required: true, unique: true },
+    version: { type: Number, default: 0 },
+    pending: [{ _id: false, v: Number, at: Date }]
+  },
+  { versionKey: false }
+);
+
+const SyncState = mongoose.model('SyncState', syncStateSchema);
+
+export default SyncState;
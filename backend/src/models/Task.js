@@ -0,0 +1,48 @@
+import mongoose from 'mongoose';
+
+const { Schema } = mongoose;
+
+const taskSchema = new Schema(
+  {
+    userId: { type: Schema.Types.ObjectId, ref: 'User', required: true },
+    title: { type: String, required: true, trim: true, maxlength: 200 },
+    description: { type: String, maxlength: 2000 },
+    dueDate: { type: Date },
+    priority: { type: String, enum: ['low', 'medium', 'high'], default: 'medium' },
+    tags: [{ type: String, trim: true, maxlength: 30 }],
+    category: { type: String, trim: true, maxlength: 50 },
+    isCompleted: { type: Boolean, default: false },
+    completedAt: { type: Date },
+    // Sync clock value of the batch that last wrote this task (see SyncState)
+    syncVersion: { type: Number },
+    // Derived search terms (see utils/searchTokens.js), written by taskService
+    // alongside each change; never returned to clients
+    searchTokens: { type: [String], select: false }
+  },
+  { timestamps: true }
+);
+
+// Compound indexes backing keyset pagination. Each one ends in _id so that
+// the (sort value, _id) pair is unique and a cursor can resume exactly.
+taskSchema.index({ userId: 1, createdAt: -1, _id: -1 });
+taskSchema.index({ userId: 1, isCompleted: 1, createdAt: -1, _id: -1 });
+taskSchema.index({ userId: 1, dueDate: 1, _id: 1 });
+taskSchema.index({ userId: 1, syncVersion: 1, _id: 1 });
+
+// Full-text search. The userId prefix keeps every $text query scoped to one
+// user's tasks; searchTokens carries the n-grams for Korean text.
+taskSchema.index(
+  { userId: 1, title: 'text', tags: 'text', category: 'text', searchTokens: 'text', description: 'text' },
+  {
+    name: 'task_search',
+    default_language: 'none',
+    weights: { title: 10, tags: 6, category: 4, searchTokens: 3, description: 1 }
+  }
+);
+
+// Fields returned by list endpoints
+export const LIST_PROJECTION = '-__v';
+
+const Task = mongoose.model('Task', taskSchema);
+
+export default Task;
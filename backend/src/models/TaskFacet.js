@@ -0,0 +1,20 @@
+import mongoose from 'mongoose';
+
+const { Schema } = mongoose;
+
+// Per-user tag/category counters, maintained incrementally by task writes
+const taskFacetSchema = new Schema(
+  {
+    userId: { type: Schema.Types.ObjectId, ref: 'User', required: true },
+    kind: { type: String, enum: ['tag', 'category'], required: true },
+    value: { type: String, required: true },
+    count: { type: Number, default: 0 }
+  },
+  { versionKey: false }
+);
+
+taskFacetSchema.index({ userId: 1, kind: 1, value: 1 }, { unique: true });
+
+const TaskFacet = mongoose.model('TaskFacet', taskFacetSchema);
+
+export default TaskFacet;
@@ -0,0 +1,23 @@
+import mongoose from 'mongoose';
+
+const { Schema } = mongoose;
+
+export const TOMBSTONE_RETENTION_DAYS = 90;
+
+// Record of a deleted task, served to sync clients until it expires
+const taskTombstoneSchema = new Schema(
+  {
+    userId: { type: Schema.Types.ObjectId, ref: 'User', required: true },
+    taskId: { type: Schema.Types.ObjectId, required: true },
+    syncVersion: { type: Number, required: true },
+    deletedAt: { type: Date, default: Date.now }
+  },
+  { versionKey: false }
+);
+
+taskTombstoneSchema.index({ userId: 1, syncVersion: 1 });
+taskTombstoneSchema.index({ deletedAt: 1 }, { expireAfterSeconds: TOMBSTONE_RETENTION_DAYS * 24 * 60 * 60 });
+
+const TaskTombstone = mongoose.model('TaskTombstone', taskTombstoneSchema);
+
+export default TaskTombstone;
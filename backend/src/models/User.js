@@ -0,0 +1,31 @@
+import mongoose from 'mongoose';
+
+const { Schema } = mongoose;
+
+const userSchema = new Schema(
+  {
+    email: { type: String, required: true, unique: true, lowercase: true, trim: true },
+    name: { type: String, required: true, trim: true },
+    passwordHash: { type: String, required: true, select: false },
+    provider: { type: String, enum: ['local', 'google', 'kakao'], default: 'local' },
+    providerId: { type: String },
+    profileImage: { type: String },
+    preferences: {
+      theme: { type: String, enum: ['light', 'dark', 'system'], default: 'system' },
+      defaultView: { type: String, enum: ['list', 'grid'], default: 'list' }
+    }
+  },
+  { timestamps: true }
+);
+
+userSchema.set('toJSON', {
+  transform: (doc, ret) => {
+    delete ret.passwordHash;
+    delete ret.__v;
+    return ret;
+  }
+});
+
+const User = mongoose.model('User', userSchema);
+
+export default User;
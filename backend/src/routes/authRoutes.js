@@ -0,0 +1,13 @@
+import { Router } from 'express';
+import { login, signup } from '../controllers/authController.js';
+import { recordMountPath } from '../middleware/requestMetrics.js';
+import { validate } from '../middleware/validation.js';
+import { loginBodySchema, signupBodySchema } from '../validators/authSchemas.js';
+
+const router = Router();
+
+router.use(recordMountPath);
+router.post('/signup', validate(signupBodySchema), signup);
+router.post('/login', validate(loginBodySchema), login);
+
+export default router;
@@ -0,0 +1,15 @@
+import { Router } from 'express';
+import { getSync } from '../controllers/syncController.js';
+import { protect } from '../middleware/authMiddleware.js';
+import { recordMountPath } from '../middleware/requestMetrics.js';
+import { validate } from '../middleware/validation.js';
+import { syncQuerySchema } from '../validators/syncSchemas.js';
+
+const router = Router();
+
+router.use(recordMountPath);
+router.use(protect);
+
+router.get('/', validate(syncQuerySchema, 'query'), getSync);
+
+export default router;
@@ -0,0 +1,18 @@
+import { Router } from 'express';
+import { bulkTasks, getCounts, getTasks, search } from '../controllers/taskController.js';
+import { protect } from '../middleware/authMiddleware.js';
+import { recordMountPath } from '../middleware/requestMetrics.js';
+import { validate } from '../middleware/validation.js';
+import { bulkBodySchema, listQuerySchema, searchQuerySchema } from '../validators/taskSchemas.js';
+
+const router = Router();
+
+router.use(recordMountPath);
+router.use(protect);
+
+router.get('/', validate(listQuerySchema, 'query'), getTasks);
+router.get('/counts', getCounts);
+router.get('/search', validate(searchQuerySchema, 'query'), search);
+router.post('/bulk', validate(bulkBodySchema), bulkTasks);
+
+export default router;
@@ -0,0 +1,47 @@
+import { randomBytes } from 'node:crypto';
+import jwt from 'jsonwebtoken';
+import { jwtConfig } from '../config/jwt.js';
+import User from '../models/User.js';
+import { ApiError } from '../utils/ApiError.js';
+import { hashPassword, verifyPassword } from './passwordService.js';
+
+const issueToken = (user) => jwt.sign({ id: String(user._id) }, jwtConfig.secret, { expiresIn: jwtConfig.expiresIn });
+
+export const signup = async ({ email, name, password }) => {
+  if (await User.exists({ email })) {
+    throw new ApiError(409, 'Email is already registered');
+  }
+
+  const passwordHash = await hashPassword(password);
+  let user;
+  try {
+    user = await User.create({ email, name, passwordHash });
+  } catch (err) {
+    // A concurrent signup won the unique email index
+    if (err.code === 11000) throw new ApiError(409, 'Email is already registered');
+    throw err;
+  }
+  return { user, token: issueToken(user) };
+};
+
+// Hash compared against when the email is unknown, so a login for an
+// unregistered email takes as long as a wrong password and does not reveal
+// which emails exist. Created once, at the configured cost.
+let dummyHash;
+const getDummyHash = () => {
+  dummyHash ??= hashPassword(randomBytes(16).toString('hex')).catch((err) => {
+    dummyHash = undefined;
+    throw err;
+  });
+  return dummyHash;
+};
+
+export const login = async ({ email, password }) => {
+  const user = await User.findOne({ email }).select('+passwordHash');
+  const matches = await verifyPassword(password, user ? user.passwordHash : await getDummyHash());
+  if (!user || !matches) {
+    throw ApiError.unauthorized('Invalid email or password');
+  }
+
+  return { user, token: issueToken(user) };
+};
@@ -0,0 +1,28 @@
+import { env } from '../config/env.js';
+import { ApiError } from '../utils/ApiError.js';
+import { WorkerPool } from '../utils/WorkerPool.js';
+
+// bcrypt is CPU-bound; hashing and comparison run on a small dedicated pool
+// of worker threads so a login burst queues here instead of stalling the
+// event loop, and the queue bound sheds load once it is saturated.
+const pool = new WorkerPool(new URL('../workers/passwordWorker.js', import.meta.url), {
+  size: env.bcryptPoolSize,
+  maxQueue: env.bcryptMaxQueue
+});
+
+const run = async (op, args) => {
+  try {
+    return await pool.run(op, args);
+  } catch (err) {
+    if (err.code === 'POOL_QUEUE_FULL') {
+      throw new ApiError(503, 'Authentication is busy, please retry shortly');
+    }
+    throw err;
+  }
+};
+
+export const hashPassword = (password, cost = env.bcryptCost) => run('hash', [password, cost]);
+
+export const verifyPassword = (password, hash) => run('compare', [password, hash]);
+
+export const closePasswordPool = () => pool.destroy();
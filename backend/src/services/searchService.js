@@ -0,0 +1,132 @@
+import mongoose from 'mongoose';
+import { taskCache } from '../cache/index.js';
+import Task from '../models/Task.js';
+import TaskFacet from '../models/TaskFacet.js';
+import { ApiError } from '../utils/ApiError.js';
+import { buildSearchTokens, tokenize } from '../utils/searchTokens.js';
+
+const FACET_KEY_SEPARATOR = '\u0000';
+
+// Facet entries contributed by one task snapshot (or none for a missing task)
+const facetEntries = (snapshot) => {
+  if (!snapshot) return [];
+  const entries = [...new Set(snapshot.tags ?? [])].map((tag) => `tag${FACET_KEY_SEPARATOR}${tag}`);
+  if (snapshot.category) entries.push(`category${FACET_KEY_SEPARATOR}${snapshot.category}`);
+  return entries;
+};
+
+// Counter changes caused by a task moving from `before` to `after`
+export const facetDelta = (before, after) => {
+  const delta = new Map();
+  for (const key of facetEntries(before)) delta.set(key, (delta.get(key) ?? 0) - 1);
+  for (const key of facetEntries(after)) delta.set(key, (delta.get(key) ?? 0) + 1);
+  for (const [key, value] of delta) {
+    if (value === 0) delta.delete(key);
+  }
+  return delta;
+};
+
+export const mergeFacetDeltas = (deltas) => {
+  const merged = new Map();
+  for (const delta of deltas) {
+    for (const [key, value] of delta) merged.set(key, (merged.get(key) ?? 0) + value);
+  }
+  return merged;
+};
+
+// Apply counter changes with a single upserting bulkWrite, then drop empty facets
+export const applyFacetDeltas = async (userId, delta) => {
+  const ownerId = new mongoose.Types.ObjectId(userId);
+  const writes = [];
+  for (const [key, value] of delta) {
+    if (value === 0) continue;
+    const [kind, facetValue] = key.split(FACET_KEY_SEPARATOR);
+    writes.push({
+      updateOne: {
+        filter: { userId: ownerId, kind, value: facetValue },
+        update: { $inc: { count: value } },
+        upsert: true
+      }
+    });
+  }
+  if (!writes.length) return;
+
+  await TaskFacet.bulkWrite(writes, { ordered: false });
+  await TaskFacet.deleteMany({ userId: ownerId, count: { $lte: 0 } });
+};
+
+const loadFacets = async (userId) => {
+  const rows = await TaskFacet.find({ userId: new mongoose.Types.ObjectId(userId) })
+    .sort({ count: -1, value: 1 })
+    .select('kind value count')
+    .lean();
+
+  const facets = { tags: [], categories: [] };
+  for (const { kind, value, count } of rows) {
+    (kind === 'tag' ? facets.tags : facets.categories).push({ name: value, count });
+  }
+  return facets;
+};
+
+export const getFacets = (userId) => taskCache.wrap(userId, 'facets', {}, () => loadFacets(userId));
+
+// Ranked search over title, description, tags and category. Every query token
+// must be present (precision), while textScore orders the matches (ranking).
+// Ranking has to score every match anyway, so pages are addressed by number.
+const runSearch = async (userId, { q, tag, category, completed, page, limit }) => {
+  const tokens = tokenize(q);
+  if (!tokens.length) {
+    throw ApiError.badRequest('Search query has no searchable terms');
+  }
+
+  const filter = {
+    userId: new mongoose.Types.ObjectId(userId),
+    $text: { $search: tokens.join(' ') },
+    searchTokens: { $all: tokens }
+  };
+  if (tag) filter.tags = tag;
+  if (category) filter.category = category;
+  if (completed !== undefined) filter.isCompleted = completed;
+
+  const rows = await Task.find(filter)
+    .select({ score: { $meta: 'textScore' }, __v: 0 })
+    .sort({ score: { $meta: 'textScore' }, _id: -1 })
+    .skip((page - 1) * limit)
+    .limit(limit + 1)
+    .lean();
+
+  const hasMore = rows.length > limit;
+  return { tasks: hasMore ? rows.slice(0, limit) : rows, page, limit, hasMore };
+};
+
+export const searchTasks = async (userId, { q, tag, category, completed, page, limit }) => {
+  const query = { q, tag, category, completed, page, limit };
+  const [results, facets] = await Promise.all([
+    taskCache.wrap(userId, 'search', query, () => runSearch(userId, query)),
+    getFacets(userId)
+  ]);
+  return { ...results, facets };
+};
+
+// Recompute searchTokens and facet counters from scratch, e.g. after importing
+// tasks written outside taskService or when enabling search on existing data.
+export const rebuildSearchIndex = async (userId) => {
+  const ownerId = new mongoose.Types.ObjectId(userId);
+  const cursor = Task.find({ userId: ownerId }).select('title description tags category').lean().cursor();
+
+  let writes = [];
+  const facets = new Map();
+  for await (const task of cursor) {
+    writes.push({ updateOne: { filter: { _id: task._id }, update: { $set: { searchTokens: buildSearchTokens(task) } } } });
+    for (const [key, value] of facetDelta(null, task)) facets.set(key, (facets.get(key) ?? 0) + value);
+    if (writes.length === 1000) {
+      await Task.bulkWrite(writes, { ordered: false });
+      writes = [];
+    }
+  }
+  if (writes.length) await Task.bulkWrite(writes, { ordered: false });
+
+  await TaskFacet.deleteMany({ userId: ownerId });
+  await applyFacetDeltas(userId, facets);
+  await taskCache.invalidate(userId);
+};
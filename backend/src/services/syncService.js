@@ -0,0 +1,96 @@
+import mongoose from 'mongoose';
+import SyncState from '../models/SyncState.js';
+import Task, { LIST_PROJECTION } from '../models/Task.js';
+import TaskTombstone, { TOMBSTONE_RETENTION_DAYS } from '../models/TaskTombstone.js';
+import { buildKeysetFilter, decodeCursor, encodeCursor } from '../utils/cursor.js';
+
+// A batch that has not finished within this window is assumed to have died
+// (e.g. process crash) and no longer holds readers back.
+const PENDING_TIMEOUT_MS = 60_000;
+
+const toObjectId = (userId) => new mongoose.Types.ObjectId(userId);
+
+// Allocate the next sync version for a write batch and mark it pending.
+// Runs as a single atomic pipeline update that also drops stale entries.
+export const beginSyncWrite = async (userId) => {
+  const state = await SyncState.collection.findOneAndUpdate(
+    { userId: toObjectId(userId) },
+    [
+      { $set: { version: { $add: [{ $ifNull: ['$version', 0] }, 1] } } },
+      {
+        $set: {
+          pending: {
+            $concatArrays: [
+              {
+                $filter: {
+                  input: { $ifNull: ['$pending', []] },
+                  cond: { $gt: ['$$this.at', { $subtract: ['$$NOW', PENDING_TIMEOUT_MS] }] }
+                }
+              },
+              [{ v: '$version', at: '$$NOW' }]
+            ]
+          }
+        }
+      }
+    ],
+    { upsert: true, returnDocument: 'after' }
+  );
+  return state.version;
+};
+
+export const endSyncWrite = (userId, version) =>
+  SyncState.updateOne({ userId: toObjectId(userId) }, { $pull: { pending: { v: version } } });
+
+// Highest version whose writes are all visible: just below the oldest batch
+// still in progress, or the latest version when nothing is pending.
+const readSyncClock = async (userId) => {
+  const state = await SyncState.findOne({ userId: toObjectId(userId) }).lean();
+  if (!state) return { version: 0, safe: 0 };
+
+  const cutoff = Date.now() - PENDING_TIMEOUT_MS;
+  const live = (state.pending ?? []).filter((entry) => entry.at.getTime() > cutoff).map((entry) => entry.v);
+  return { version: state.version, safe: live.length ? Math.min(...live) - 1 : state.version };
+};
+
+// Tasks changed after `since` (all tasks when since = 0), paged by
+// (syncVersion, _id). Tombstones for deletions come with the last page so
+// that deletions made while a client pages through are not missed.
+export const getChanges = async (userId, { since, cursor, limit }) => {
+  const { version, safe } = await readSyncClock(userId);
+  const meta = { version: safe, retentionDays: TOMBSTONE_RETENTION_DAYS };
+
+  // The client is ahead of the server (e.g. restored database): start over
+  if (since > version) {
+    return { ...meta, reset: true, tasks: [], deleted: [], nextCursor: null };
+  }
+
+  const range =
+    since === 0
+      ? { $or: [{ syncVersion: { $lte: safe } }, { syncVersion: null }] }
+      : { syncVersion: { $gt: since, $lte: safe } };
+  const conditions = [{ userId: toObjectId(userId) }, range];
+  if (cursor) {
+    conditions.push(buildKeysetFilter('syncVersion', 'asc', decodeCursor(cursor, 'syncVersion', 'asc')));
+  }
+
+  const rows = await Task.find({ $and: conditions })
+    .sort({ syncVersion: 1, _id: 1 })
+    .select(LIST_PROJECTION)
+    .limit(limit + 1)
+    .lean();
+
+  const hasMore = rows.length > limit;
+  const tasks = hasMore ? rows.slice(0, limit) : rows;
+  if (hasMore) {
+    return { ...meta, tasks, deleted: [], nextCursor: encodeCursor(tasks[tasks.length - 1], 'syncVersion', 'asc') };
+  }
+
+  const deleted =
+    since === 0
+      ? []
+      : await TaskTombstone.find({ userId: toObjectId(userId), syncVersion: { $gt: since, $lte: safe } })
+          .select('taskId')
+          .lean();
+
+  return { ...meta, tasks, deleted: deleted.map(({ taskId }) => String(taskId)), nextCursor: null };
+};
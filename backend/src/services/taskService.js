@@ -0,0 +1,425 @@
+import mongoose from 'mongoose';
+import { taskCache } from '../cache/index.js';
+import Task, { LIST_PROJECTION } from '../models/Task.js';
+import TaskTombstone from '../models/TaskTombstone.js';
+import { coalesceOperations, mergeTags } from '../utils/bulkOperations.js';
+import { buildKeysetFilter, decodeCursor, encodeCursor } from '../utils/cursor.js';
+import { buildSearchTokens } from '../utils/searchTokens.js';
+import { applyFacetDeltas, facetDelta, getFacets, mergeFacetDeltas } from './searchService.js';
+import { beginSyncWrite, endSyncWrite } from './syncService.js';
+
+const buildListQuery = (userId, { sortBy, order, cursor, completed }) => {
+  const filter = { userId: new mongoose.Types.ObjectId(userId) };
+  if (completed !== undefined) {
+    filter.isCompleted = completed;
+  }
+
+  const conditions = [filter];
+  if (cursor) {
+    conditions.push(buildKeysetFilter(sortBy, order, decodeCursor(cursor, sortBy, order)));
+  }
+
+  const direction = order === 'asc' ? 1 : -1;
+  return Task.find(conditions.length > 1 ? { $and: conditions } : filter)
+    .sort({ [sortBy]: direction, _id: direction })
+    .select(LIST_PROJECTION)
+    .lean();
+};
+
+// Fetch one page of tasks after `cursor`. One extra row is read to decide
+// whether another page exists without a separate count query.
+const fetchTaskPage = async (userId, options) => {
+  const { limit, sortBy, order } = options;
+  const rows = await buildListQuery(userId, options).limit(limit + 1);
+
+  const hasMore = rows.length > limit;
+  const tasks = hasMore ? rows.slice(0, limit) : rows;
+  const nextCursor = hasMore ? encodeCursor(tasks[tasks.length - 1], sortBy, order) : null;
+
+  return { tasks, nextCursor };
+};
+
+export const listTasks = (userId, { cursor, limit, sortBy, order, completed }) => {
+  const query = { cursor, limit, sortBy, order, completed };
+  return taskCache.wrap(userId, 'list', query, () => fetchTaskPage(userId, query));
+};
+
+// Sidebar counters: totals by completion state and overdue tasks
+const aggregateStatusCounts = async (userId) => {
+  const now = new Date();
+  const [status = {}] = await Task.aggregate([
+    { $match: { userId: new mongoose.Types.ObjectId(userId) } },
+    {
+      $group: {
+        _id: null,
+        total: { $sum: 1 },
+        completed: { $sum: { $cond: ['$isCompleted', 1, 0] } },
+        overdue: {
+          $sum: {
+            $cond: [
+              { $and: [{ $not: ['$isCompleted'] }, { $gt: ['$dueDate', null] }, { $lt: ['$dueDate', now] }] },
+              1,
+              0
+            ]
+          }
+        }
+      }
+    }
+  ]);
+
+  const { total = 0, completed = 0, overdue = 0 } = status;
+  return { total, completed, active: total - completed, overdue };
+};
+
+// Per-category counts come from the incrementally maintained facet index
+export const getTaskCounts = async (userId) => {
+  const [status, facets] = await Promise.all([
+    taskCache.wrap(userId, 'counts', {}, () => aggregateStatusCounts(userId)),
+    getFacets(userId)
+  ]);
+  return { ...status, categories: facets.categories };
+};
+
+// Stream one page of tasks as an async iterable of lean documents. The last
+// yielded item is `{ nextCursor }` so callers can continue paging.
+export async function* streamTasks(userId, options) {
+  const { limit, sortBy, order } = options;
+  const cursor = buildListQuery(userId, options).limit(limit + 1).cursor({ batchSize: 500 });
+
+  let count = 0;
+  let last = null;
+  let hasMore = false;
+  try {
+    for await (const task of cursor) {
+      if (count === limit) {
+        hasMore = true;
+        break;
+      }
+      count += 1;
+      last = task;
+      yield { task };
+    }
+  } finally {
+    await cursor.close();
+  }
+
+  yield { nextCursor: hasMore ? encodeCursor(last, sortBy, order) : null };
+}
+
+const completionUpdate = (isCompleted) =>
+  isCompleted
+    ? { $set: { isCompleted: true, completedAt: new Date() } }
+    : { $set: { isCompleted: false }, $unset: { completedAt: 1 } };
+
+const changesUpdate = (changes) => {
+  const update = { $set: { ...changes } };
+  if (changes.tags) update.$set.tags = [...new Set(changes.tags)];
+  if (changes.isCompleted !== undefined) {
+    const completion = completionUpdate(changes.isCompleted);
+    Object.assign(update.$set, completion.$set);
+    if (completion.$unset) update.$unset = completion.$unset;
+  }
+  return update;
+};
+
+// New tag list for an update that adds and/or removes tags. MongoDB rejects
+// $addToSet and $pull on the same path in one update, so the list is computed
+// in an aggregation pipeline update instead: existing tags keep their order
+// and new ones are appended (see mergeTags). $literal keeps user strings from
+// being read as field paths.
+const tagDeltaExpression = (addTags = [], removeTags = []) => ({
+  $let: {
+    vars: { current: { $ifNull: ['$tags', []] } },
+    in: {
+      $filter: {
+        input: {
+          $concatArrays: [
+            '$$current',
+            {
+              $filter: {
+                input: { $literal: [...new Set(addTags)] },
+                cond: { $not: [{ $in: ['$$this', '$$current'] }] }
+              }
+            }
+          ]
+        },
+        cond: { $not: [{ $in: ['$$this', { $literal: removeTags }] }] }
+      }
+    }
+  }
+});
+
+// The same update as a single pipeline stage, plus computed `fields`
+const toPipeline = ({ $set = {}, $unset }, fields) => {
+  const stages = [
+    {
+      $set: {
+        ...Object.fromEntries(Object.entries($set).map(([field, value]) => [field, { $literal: value }])),
+        ...fields
+      }
+    }
+  ];
+  if ($unset) stages.push({ $unset: Object.keys($unset) });
+  return stages;
+};
+
+const SEARCH_FIELDS = ['title', 'description', 'tags', 'category'];
+
+// Searchable fields of a task after `operation` (see normalizeOperation), or
+// the same snapshot when the operation does not touch them. Returns null once
+// the task is deleted.
+const nextSnapshot = (snapshot, operation) => {
+  switch (operation.op) {
+    case 'create':
+      return Object.fromEntries(SEARCH_FIELDS.map((field) => [field, operation.task[field]]));
+    case 'update': {
+      const { changes, addTags = [], removeTags = [] } = operation;
+      const touched = SEARCH_FIELDS.filter((field) => changes[field] !== undefined);
+      const retagged = addTags.length > 0 || removeTags.length > 0;
+      if (!touched.length && !retagged) return snapshot;
+
+      const next = { ...snapshot, ...Object.fromEntries(touched.map((field) => [field, changes[field]])) };
+      if (retagged) next.tags = mergeTags(next.tags, addTags, removeTags);
+      return next;
+    }
+    case 'delete':
+      return null;
+    default:
+      return snapshot;
+  }
+};
+
+// Exactly one write per effective operation
+const toWrite = (operation, userId, searchTokens, syncVersion) => {
+  const filter = { _id: operation.id, userId };
+
+  switch (operation.op) {
+    case 'create': {
+      const { task } = operation;
+      const _id = operation.id ? new mongoose.Types.ObjectId(operation.id) : new mongoose.Types.ObjectId();
+      const document = { ...task, _id, userId, searchTokens, syncVersion };
+      if (task.isCompleted) document.completedAt = new Date();
+      return { insertOne: { document } };
+    }
+    case 'update': {
+      const update = changesUpdate(operation.changes);
+      update.$set.syncVersion = syncVersion;
+      if (searchTokens) update.$set.searchTokens = searchTokens;
+      if (!operation.addTags?.length && !operation.removeTags?.length) {
+        return { updateOne: { filter, update } };
+      }
+      const tags = tagDeltaExpression(operation.addTags, operation.removeTags);
+      return { updateOne: { filter, update: toPipeline(update, { tags }) } };
+    }
+    case 'delete':
+      return { deleteOne: { filter } };
+    default:
+      throw new Error(`Unknown bulk operation: ${operation.op}`);
+  }
+};
+
+const DUPLICATE_KEY = 11000;
+
+// A task deleted between the ownership read and the write matches nothing.
+// bulkWrite only reports totals, so when they fall short the affected
+// entries are found with one extra read and reported as not_found.
+const markUnmatched = async (ownerId, syncVersion, entries, outcome) => {
+  const pending = (kind) => entries.filter((entry) => entry.write && kind in entry.write && entry.status === 'ok');
+  const updated = pending('updateOne');
+  const deleted = pending('deleteOne');
+
+  if ((outcome?.matchedCount ?? 0) < updated.length) {
+    // Every matched update stamped this batch's sync version (or a later one)
+    const stamped = await Task.find({
+      _id: { $in: updated.map((entry) => entry.operation.id) },
+      userId: ownerId,
+      syncVersion: { $gte: syncVersion }
+    })
+      .select('_id')
+      .lean();
+    const found = new Set(stamped.map((task) => String(task._id)));
+    updated.forEach((entry) => {
+      if (!found.has(entry.operation.id)) entry.status = 'not_found';
+    });
+  }
+
+  if ((outcome?.deletedCount ?? 0) < deleted.length) {
+    // Another batch deleted these first and recorded the tombstone; a batch
+    // that has not written its tombstone yet cannot be told apart
+    const recorded = await TaskTombstone.find({
+      userId: ownerId,
+      taskId: { $in: deleted.map((entry) => entry.operation.id) },
+      syncVersion: { $ne: syncVersion }
+    })
+      .select('taskId')
+      .lean();
+    const gone = new Set(recorded.map((tombstone) => String(tombstone.taskId)));
+    deleted.forEach((entry) => {
+      if (gone.has(entry.operation.id)) entry.status = 'not_found';
+    });
+  }
+};
+
+const targetsExisting = ({ op, id }) => op !== 'create' && id;
+
+// Ownership and the current searchable fields of `ids`, with one indexed read
+const readSnapshots = async (ownerId, ids) => {
+  const stored = ids.length
+    ? await Task.find({ _id: { $in: ids }, userId: ownerId }).select(SEARCH_FIELDS.join(' ')).lean()
+    : [];
+  return new Map(stored.map((task) => [String(task._id), task]));
+};
+
+// A create whose client-generated id is already stored is a retry (e.g. the
+// response to the first attempt was lost). The create reports `exists`; the
+// edits folded into it are applied to the stored task as an update.
+const retryAsUpdate = (entry, snapshots) => {
+  const { id, edits } = entry.operation;
+  entry.id = id;
+  entry.createStatus = 'exists';
+  if (!edits || !snapshots.has(id)) {
+    // No edits, or the id belongs to another user's task
+    entry.status = edits ? 'not_found' : 'exists';
+    entry.skip = true;
+    return;
+  }
+  entry.operation = edits;
+  entry.status = 'ok';
+  entry.skip = false;
+};
+
+// Build the write for `entry` along with its search tokens and facet delta
+const planWrite = (entry, snapshots, ownerId, syncVersion) => {
+  const { operation } = entry;
+  const before = targetsExisting(operation) ? snapshots.get(operation.id) : null;
+  const after = nextSnapshot(before, operation);
+  const searchTokens = after && after !== before ? buildSearchTokens(after) : undefined;
+  entry.write = toWrite(operation, ownerId, searchTokens, syncVersion);
+  if (operation.op === 'create') entry.id = String(entry.write.insertOne.document._id);
+  entry.facetDelta = facetDelta(before, after);
+};
+
+// Send the planned writes of `entries` as one unordered bulkWrite and record
+// each entry's status. Returns the driver's totals.
+const writeEntries = async (ownerId, syncVersion, entries) => {
+  let outcome;
+  try {
+    outcome = await Task.bulkWrite(entries.map((entry) => entry.write), { ordered: false });
+  } catch (err) {
+    if (!err.writeErrors && !err.result) throw err;
+    outcome = err.result;
+    for (const writeError of [].concat(err.writeErrors ?? [])) {
+      const entry = entries[writeError.index];
+      // A create whose client-generated id landed after the up-front read
+      if (writeError.code === DUPLICATE_KEY && entry.operation.op === 'create') {
+        entry.status = 'exists';
+        continue;
+      }
+      entry.status = 'error';
+      entry.error = writeError.errmsg ?? writeError.message;
+    }
+  }
+
+  // Mongoose reports per-document cast/validation failures here when
+  // running unordered instead of throwing.
+  (outcome?.mongoose?.results ?? []).forEach((result, writeIndex) => {
+    if (result instanceof Error) {
+      entries[writeIndex].status = 'error';
+      entries[writeIndex].error = result.message;
+    }
+  });
+
+  await markUnmatched(ownerId, syncVersion, entries, outcome);
+  return outcome;
+};
+
+// Apply a batch of task mutations with a single unordered bulkWrite and
+// report a result for every operation, in request order. Operations on the
+// same task are first folded into one write (see utils/bulkOperations.js).
+// Search tokens, tag/category facet counters and the sync clock are kept in
+// step with the same batch.
+export const bulkMutateTasks = async (userId, operations) => {
+  const ownerId = new mongoose.Types.ObjectId(userId);
+  // Operations dropped by coalescing keep the default not_found result
+  const { entries } = coalesceOperations(operations);
+  entries.forEach((entry) => {
+    entry.status = 'ok';
+  });
+
+  // Ownership and the current searchable fields are resolved up front, so
+  // operations on missing or foreign tasks are reported instead of silently
+  // matching nothing. Creates with a client id are read too, to catch retries.
+  const ids = [...new Set(entries.map((entry) => entry.operation.id).filter(Boolean))];
+  const snapshots = await readSnapshots(ownerId, ids);
+
+  entries.forEach((entry) => {
+    const { operation } = entry;
+    if (operation.op === 'create' && operation.id && snapshots.has(operation.id)) {
+      retryAsUpdate(entry, snapshots);
+    } else if (targetsExisting(operation) && !snapshots.has(operation.id)) {
+      // Created and deleted within this batch: nothing was stored, nothing to undo
+      entry.status = operation.created ? 'ok' : 'not_found';
+      entry.skip = true;
+    }
+  });
+
+  const summary = { inserted: 0, modified: 0, deleted: 0, failed: 0, notFound: 0 };
+  const report = () => {
+    const results = operations.map(({ op, id }) => ({ op, id, status: 'not_found' }));
+    for (const entry of entries) {
+      entry.indexes.forEach((index, position) => {
+        const status = position === 0 && entry.createStatus ? entry.createStatus : entry.status;
+        Object.assign(results[index], { status, ...(entry.id && { id: entry.id }) });
+        if (entry.error) results[index].error = entry.error;
+      });
+    }
+    for (const result of results) {
+      if (result.status === 'error') summary.failed += 1;
+      if (result.status === 'not_found') summary.notFound += 1;
+    }
+    return { results, summary };
+  };
+  const count = (outcome) => {
+    summary.inserted += outcome?.insertedCount ?? 0;
+    summary.modified += outcome?.modifiedCount ?? 0;
+    summary.deleted += outcome?.deletedCount ?? 0;
+  };
+
+  const writable = entries.filter((entry) => !entry.skip);
+  if (!writable.length) return report();
+
+  const syncVersion = await beginSyncWrite(userId);
+  try {
+    writable.forEach((entry) => planWrite(entry, snapshots, ownerId, syncVersion));
+    count(await writeEntries(ownerId, syncVersion, writable));
+
+    // A retried create that landed between the read and the write: its
+    // folded edits still have to reach the stored task
+    const collided = writable.filter((entry) => entry.status === 'exists' && entry.operation.edits);
+    if (collided.length) {
+      const stored = await readSnapshots(ownerId, collided.map((entry) => entry.operation.id));
+      collided.forEach((entry) => retryAsUpdate(entry, stored));
+      const retried = collided.filter((entry) => !entry.skip);
+      if (retried.length) {
+        retried.forEach((entry) => planWrite(entry, stored, ownerId, syncVersion));
+        count(await writeEntries(ownerId, syncVersion, retried));
+      }
+    }
+
+    const succeeded = writable.filter((entry) => entry.status === 'ok');
+    const tombstones = succeeded
+      .filter((entry) => entry.operation.op === 'delete')
+      .map((entry) => ({ userId: ownerId, taskId: entry.operation.id, syncVersion }));
+    if (tombstones.length) {
+      await TaskTombstone.insertMany(tombstones, { ordered: false, lean: true });
+    }
+
+    await applyFacetDeltas(userId, mergeFacetDeltas(succeeded.map((entry) => entry.facetDelta)));
+  } finally {
+    // Partial failures still commit the other writes
+    await endSyncWrite(userId, syncVersion);
+    await taskCache.invalidate(userId);
+  }
+
+  return report();
+};
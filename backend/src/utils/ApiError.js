@@ -0,0 +1,21 @@
+// Error carrying an HTTP status code, rendered by the error handler
+export class ApiError extends Error {
+  constructor(statusCode, message, details) {
+    super(message);
+    this.name = 'ApiError';
+    this.statusCode = statusCode;
+    this.details = details;
+  }
+
+  static badRequest(message, details) {
+    return new ApiError(400, message, details);
+  }
+
+  static unauthorized(message = 'Not authorized') {
+    return new ApiError(401, message);
+  }
+
+  static notFound(message = 'Resource not found') {
+    return new ApiError(404, message);
+  }
+}
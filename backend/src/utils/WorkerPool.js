@@ -0,0 +1,88 @@
+import { Worker } from 'node:worker_threads';
+
+// Fixed-size worker_threads pool with a bounded FIFO queue.
+//
+// Workers receive `{ id, op, args }` and reply with `{ id, result }` or
+// `{ id, error }`. A crashed worker fails its in-flight task and is replaced.
+// Workers are only ref'd while running a task, so an idle pool never keeps
+// the process alive.
+export class WorkerPool {
+  constructor(filename, { size = 1, maxQueue = Infinity, workerData } = {}) {
+    this.filename = filename;
+    this.size = size;
+    this.maxQueue = maxQueue;
+    this.workerData = workerData;
+    this.idle = [];
+    this.busy = new Map();
+    this.queue = [];
+    this.nextId = 0;
+  }
+
+  get pending() {
+    return this.queue.length;
+  }
+
+  get active() {
+    return this.busy.size;
+  }
+
+  run(op, args) {
+    if (this.queue.length >= this.maxQueue) {
+      const error = new Error('Worker pool queue is full');
+      error.code = 'POOL_QUEUE_FULL';
+      return Promise.reject(error);
+    }
+
+    return new Promise((resolve, reject) => {
+      this.queue.push({ id: (this.nextId += 1), op, args, resolve, reject });
+      this.drain();
+    });
+  }
+
+  drain() {
+    while (this.queue.length) {
+      const worker = this.idle.pop() ?? (this.busy.size < this.size ? this.spawn() : null);
+      if (!worker) return;
+
+      const task = this.queue.shift();
+      this.busy.set(worker, task);
+      worker.ref();
+      worker.postMessage({ id: task.id, op: task.op, args: task.args });
+    }
+  }
+
+  spawn() {
+    const worker = new Worker(this.filename, { workerData: this.workerData });
+
+    worker.on('message', ({ result, error }) => {
+      const task = this.busy.get(worker);
+      this.busy.delete(worker);
+      this.idle.push(worker);
+      worker.unref();
+      if (error) task.reject(new Error(error));
+      else task.resolve(result);
+      this.drain();
+    });
+
+    const fail = (err) => {
+      this.busy.get(worker)?.reject(err);
+      this.busy.delete(worker);
+    };
+
+    worker.on('error', fail);
+
+    worker.on('exit', (code) => {
+      fail(new Error(`Worker exited with code ${code}`));
+      this.idle = this.idle.filter((w) => w !== worker);
+      this.drain();
+    });
+
+    return worker;
+  }
+
+  async destroy() {
+    const workers = [...this.idle, ...this.busy.keys()];
+    this.idle = [];
+    await Promise.all(workers.map((worker) => worker.terminate()));
+  }
+}
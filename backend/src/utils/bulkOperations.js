@@ -0,0 +1,105 @@
+// Planning helpers for POST /api/tasks/bulk.
+//
+// Offline clients replay their outbox as one batch, so the same task can
+// appear several times: created and then edited, or edited and then deleted.
+// An unordered bulkWrite gives no ordering between writes, and a task created
+// in the batch does not exist yet when ownership is checked. Operations on
+// the same id are therefore folded into one effective operation, which
+// becomes exactly one write.
+
+const unique = (values) => [...new Set(values)];
+
+// Tag list after adding and removing tags: existing order is kept, new tags
+// are appended and removals win
+export const mergeTags = (tags = [], addTags = [], removeTags = []) =>
+  unique([...tags, ...addTags]).filter((tag) => !removeTags.includes(tag));
+
+// Every operation on an existing task as { op: 'update', id, changes } with
+// optional addTags/removeTags; creates and deletes pass through
+export const normalizeOperation = (operation) => {
+  switch (operation.op) {
+    case 'complete':
+      return { op: 'update', id: operation.id, changes: { isCompleted: operation.isCompleted ?? true } };
+    case 'retag': {
+      const { id, tags, addTags = [], removeTags = [], category } = operation;
+      const changes = {};
+      if (tags) changes.tags = tags;
+      if (category !== undefined) changes.category = category;
+      return { op: 'update', id, changes, addTags, removeTags };
+    }
+    default:
+      return operation;
+  }
+};
+
+const foldUpdate = (previous, next) => {
+  const changes = { ...previous.changes, ...next.changes };
+  let addTags = previous.addTags ?? [];
+  let removeTags = previous.removeTags ?? [];
+  const nextAdd = next.addTags ?? [];
+  const nextRemove = next.removeTags ?? [];
+
+  if (next.changes.tags !== undefined) {
+    // A full tag list replaces whatever was added or removed before
+    addTags = [];
+    removeTags = [];
+  }
+  if (changes.tags !== undefined) {
+    changes.tags = mergeTags(changes.tags, nextAdd, nextRemove);
+  } else {
+    addTags = unique([...addTags.filter((tag) => !nextRemove.includes(tag)), ...nextAdd]);
+    removeTags = unique([...removeTags.filter((tag) => !nextAdd.includes(tag)), ...nextRemove]);
+  }
+  return { op: 'update', id: previous.id, changes, addTags, removeTags };
+};
+
+// Apply `next` on top of the effective operation so far
+const fold = (previous, next) => {
+  if (next.op === 'delete') {
+    // `created` marks a task that may never have reached the database
+    return { op: 'delete', id: previous.id, created: previous.op === 'create' };
+  }
+  if (previous.op === 'create') {
+    const task = { ...previous.task, ...next.changes };
+    if (next.addTags?.length || next.removeTags?.length) {
+      task.tags = mergeTags(task.tags, next.addTags, next.removeTags);
+    }
+    // A retried create may already be stored, in which case the insert is a
+    // duplicate and `edits` is applied as an update instead
+    const edits = previous.edits ? foldUpdate(previous.edits, next) : { ...next, id: previous.id };
+    return { op: 'create', id: previous.id, task, edits };
+  }
+  return foldUpdate(previous, next);
+};
+
+// Group a batch into effective operations, in order of first appearance.
+// Returns { entries: [{ operation, indexes }], dropped } where `indexes` are
+// the request positions folded into each entry and `dropped` lists
+// operations on a task already deleted earlier in the batch.
+export const coalesceOperations = (operations) => {
+  const entries = [];
+  const open = new Map();
+  const dropped = [];
+
+  operations.forEach((raw, index) => {
+    const operation = normalizeOperation(raw);
+    const entry = operation.id && open.get(operation.id);
+
+    // A create never folds: repeating one is reported by the database as `exists`
+    if (!entry || operation.op === 'create') {
+      const fresh = { operation, indexes: [index] };
+      entries.push(fresh);
+      if (operation.id) open.set(operation.id, fresh);
+      return;
+    }
+    if (entry.operation.op === 'delete') {
+      dropped.push(index);
+      return;
+    }
+
+    entry.operation = fold(entry.operation, operation);
+    entry.indexes.push(index);
+  });
+
+  return { entries, dropped };
+};
@@ -0,0 +1,66 @@
+import mongoose from 'mongoose';
+import { ApiError } from './ApiError.js';
+
+// Opaque keyset cursors: base64url-encoded JSON holding the sort key of the
+// last returned task plus its _id as a tie-breaker. Sort keys are dates
+// (flagged with `d`) or plain numbers.
+
+const { ObjectId } = mongoose.Types;
+
+export const encodeCursor = (task, sortBy, order) => {
+  const value = task[sortBy];
+  const payload = { s: sortBy, o: order, v: value ?? null, id: String(task._id) };
+  if (value instanceof Date) {
+    payload.v = value.toISOString();
+    payload.d = 1;
+  }
+  return Buffer.from(JSON.stringify(payload)).toString('base64url');
+};
+
+export const decodeCursor = (cursor, sortBy, order) => {
+  let payload;
+  try {
+    payload = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'));
+  } catch {
+    throw ApiError.badRequest('Malformed cursor');
+  }
+
+  if (!payload || !ObjectId.isValid(payload.id)) {
+    throw ApiError.badRequest('Malformed cursor');
+  }
+  if (payload.s !== sortBy || payload.o !== order) {
+    throw ApiError.badRequest('Cursor does not match the requested sort');
+  }
+
+  let value = payload.v;
+  if (payload.d) {
+    value = new Date(payload.v);
+    if (Number.isNaN(value.getTime())) throw ApiError.badRequest('Malformed cursor');
+  } else if (value !== null && typeof value !== 'number') {
+    throw ApiError.badRequest('Malformed cursor');
+  }
+
+  return { value, id: new ObjectId(payload.id) };
+};
+
+// Build the filter selecting rows strictly after the cursor position.
+// MongoDB sorts missing/null values before any date or number, so nullable
+// sort keys (dueDate, syncVersion) need their own branches.
+export const buildKeysetFilter = (sortBy, order, { value, id }) => {
+  const asc = order === 'asc';
+  const past = asc ? '$gt' : '$lt';
+
+  if (value === null) {
+    const sameNull = { [sortBy]: null, _id: { [past]: id } };
+    return asc ? { $or: [sameNull, { [sortBy]: { $ne: null } }] } : sameNull;
+  }
+
+  const branches = [
+    { [sortBy]: { [past]: value } },
+    { [sortBy]: value, _id: { [past]: id } }
+  ];
+  if (!asc) {
+    branches.push({ [sortBy]: null });
+  }
+  return { $or: branches };
+};
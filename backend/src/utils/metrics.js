@@ -0,0 +1,118 @@
+// Minimal Prometheus-style metrics registry with text exposition output
+// (https://prometheus.io/docs/instrumenting/exposition_formats/).
+
+const escapeLabel = (value) => String(value).replace(/\\/g, '\\\\').replace(/\n/g, '\\n').replace(/"/g, '\\"');
+
+const formatLabels = (labels) => {
+  const entries = Object.entries(labels);
+  if (!entries.length) return '';
+  return `{${entries.map(([key, value]) => `${key}="${escapeLabel(value)}"`).join(',')}}`;
+};
+
+const labelKey = (labels) => JSON.stringify(Object.entries(labels).sort(([a], [b]) => a.localeCompare(b)));
+
+class Metric {
+  constructor(type, name, help) {
+    this.type = type;
+    this.name = name;
+    this.help = help;
+    this.series = new Map();
+  }
+
+  entry(labels, create) {
+    const key = labelKey(labels);
+    if (!this.series.has(key)) this.series.set(key, { labels, ...create() });
+    return this.series.get(key);
+  }
+
+  header() {
+    return [`# HELP ${this.name} ${this.help}`, `# TYPE ${this.name} ${this.type}`];
+  }
+}
+
+export class Counter extends Metric {
+  constructor(name, help) {
+    super('counter', name, help);
+  }
+
+  inc(labels = {}, value = 1) {
+    this.entry(labels, () => ({ value: 0 })).value += value;
+  }
+
+  render(defaults) {
+    return [
+      ...this.header(),
+      ...[...this.series.values()].map(({ labels, value }) => `${this.name}${formatLabels({ ...defaults, ...labels })} ${value}`)
+    ];
+  }
+}
+
+// Gauges are either set directly or computed at scrape time via `collect`,
+// which returns an array of `{ labels, value }`.
+export class Gauge extends Metric {
+  constructor(name, help, collect) {
+    super('gauge', name, help);
+    this.collect = collect;
+  }
+
+  set(labels, value) {
+    this.entry(labels, () => ({ value: 0 })).value = value;
+  }
+
+  render(defaults) {
+    const samples = this.collect ? this.collect() : [...this.series.values()];
+    return [
+      ...this.header(),
+      ...samples.map(({ labels = {}, value }) => `${this.name}${formatLabels({ ...defaults, ...labels })} ${value}`)
+    ];
+  }
+}
+
+export class Histogram extends Metric {
+  constructor(name, help, buckets) {
+    super('histogram', name, help);
+    this.buckets = [...buckets].sort((a, b) => a - b);
+  }
+
+  observe(labels, value) {
+    const series = this.entry(labels, () => ({ counts: new Array(this.buckets.length).fill(0), sum: 0, count: 0 }));
+    const bucket = this.buckets.findIndex((bound) => value <= bound);
+    if (bucket !== -1) series.counts[bucket] += 1;
+    series.sum += value;
+    series.count += 1;
+  }
+
+  render(defaults) {
+    const lines = this.header();
+    for (const { labels, counts, sum, count } of this.series.values()) {
+      const base = { ...defaults, ...labels };
+      let cumulative = 0;
+      this.buckets.forEach((bound, i) => {
+        cumulative += counts[i];
+        lines.push(`${this.name}_bucket${formatLabels({ ...base, le: bound })} ${cumulative}`);
+      });
+      lines.push(`${this.name}_bucket${formatLabels({ ...base, le: '+Inf' })} ${count}`);
+      lines.push(`${this.name}_sum${formatLabels(base)} ${sum}`);
+      lines.push(`${this.name}_count${formatLabels(base)} ${count}`);
+    }
+    return lines;
+  }
+}
+
+export class Registry {
+  constructor(defaultLabels = {}) {
+    this.defaultLabels = defaultLabels;
+    this.metrics = [];
+  }
+
+  register(metric) {
+    this.metrics.push(metric);
+    return metric;
+  }
+
+  render() {
+    return `${this.metrics.flatMap((metric) => metric.render(this.defaultLabels)).join('\n')}\n`;
+  }
+}
+
+export const EXPOSITION_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8';
@@ -0,0 +1,92 @@
+import { env } from '../config/env.js';
+import { mongoCommandDuration, mongoSlowCommands } from '../config/metrics.js';
+import { requestContext } from './requestContext.js';
+
+// Commands worth timing; handshakes, heartbeats and auth are ignored
+const DATA_COMMANDS = new Set([
+  'find', 'getMore', 'aggregate', 'count', 'distinct',
+  'insert', 'update', 'delete', 'findAndModify'
+]);
+
+// Replace every literal with '?' so logs show the query shape, never user data
+const shapeOf = (value) => {
+  if (Array.isArray(value)) return value.length ? [shapeOf(value[0])] : [];
+  if (value && typeof value === 'object' && !(value instanceof Date) && !value._bsontype) {
+    return Object.fromEntries(Object.entries(value).map(([key, inner]) => [key, shapeOf(inner)]));
+  }
+  return '?';
+};
+
+// Most commands name their collection in the command field itself; getMore
+// carries the cursor id there and the collection in `collection`
+const collectionOf = (name, command) => (name === 'getMore' ? command.collection : command[name]);
+
+const commandShape = (name, command) => {
+  switch (name) {
+    case 'find':
+      return { filter: shapeOf(command.filter), sort: command.sort };
+    case 'aggregate':
+      return { pipeline: command.pipeline?.map((stage) => shapeOf(stage)) };
+    case 'count':
+    case 'distinct':
+      return { query: shapeOf(command.query) };
+    case 'findAndModify':
+      return { query: shapeOf(command.query), update: shapeOf(command.update) };
+    case 'update':
+      return { q: shapeOf(command.updates?.[0]?.q), n: command.updates?.length };
+    case 'delete':
+      return { q: shapeOf(command.deletes?.[0]?.q), n: command.deletes?.length };
+    case 'insert':
+      return { n: command.documents?.length };
+    default:
+      return undefined;
+  }
+};
+
+// Time MongoDB commands through driver command monitoring (requires the
+// client to be created with `monitorCommands: true`). Durations feed the
+// per-collection histogram and the current request's Server-Timing entry;
+// commands slower than SLOW_QUERY_MS are logged with their shape.
+export const instrumentMongoClient = (client) => {
+  const started = new Map();
+
+  client.on('commandStarted', (event) => {
+    if (!DATA_COMMANDS.has(event.commandName)) return;
+    started.set(event.requestId, {
+      collection: collectionOf(event.commandName, event.command),
+      command: event.command
+    });
+  });
+
+  const finish = (event) => {
+    const info = started.get(event.requestId);
+    if (!info) return;
+    started.delete(event.requestId);
+
+    const labels = { collection: String(info.collection), command: event.commandName };
+    mongoCommandDuration.observe(labels, event.duration / 1000);
+
+    const timing = requestContext.getStore();
+    if (timing) {
+      timing.dbMs += event.duration;
+      timing.dbCount += 1;
+    }
+
+    if (event.duration >= env.slowQueryMs) {
+      mongoSlowCommands.inc(labels);
+      console.warn(
+        JSON.stringify({
+          msg: 'slow mongodb command',
+          ...labels,
+          durationMs: event.duration,
+          failed: Boolean(event.failure),
+          request: timing?.request,
+          shape: commandShape(event.commandName, info.command)
+        })
+      );
+    }
+  };
+
+  client.on('commandSucceeded', finish);
+  client.on('commandFailed', finish);
+};
@@ -0,0 +1,24 @@
+import cluster from 'node:cluster';
+
+// Lifecycle state of this server process, shared by the request tracker,
+// the /health endpoint and graceful shutdown.
+export const processState = {
+  workerId: cluster.isWorker ? cluster.worker.id : 0,
+  startedAt: Date.now(),
+  draining: false,
+  inFlight: 0
+};
+
+// Count in-flight requests and ask clients to drop keep-alive connections
+// once the process starts draining, so they reconnect to another worker.
+export const trackRequests = (req, res, next) => {
+  processState.inFlight += 1;
+  res.once('close', () => {
+    processState.inFlight -= 1;
+  });
+
+  if (processState.draining) {
+    res.set('Connection', 'close');
+  }
+  next();
+};
@@ -0,0 +1,5 @@
+import { AsyncLocalStorage } from 'node:async_hooks';
+
+// Per-request state that follows async work started by the request, so
+// database timings can be attributed to the request that caused them.
+export const requestContext = new AsyncLocalStorage();
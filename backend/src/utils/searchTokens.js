@@ -0,0 +1,52 @@
+// Tokenizer shared by search indexing and search queries.
+//
+// MongoDB's text index has no Korean analyzer: it only splits on whitespace and
+// punctuation, so "회의록을" would never match a search for "회의록". Runs of
+// Hangul/CJK characters are therefore indexed as overlapping bigrams, while
+// other scripts are indexed as whole lowercase words. Stored tokens also
+// carry every CJK character on its own, so a one-character query such as "밥"
+// matches it inside longer words.
+//
+// Stored tokens are not capped: a search requires every query token to be
+// present, so a truncated list would make the end of long descriptions
+// unsearchable. Field length limits already bound the list.
+
+const CJK_RUN = /[ᄀ-ᇿ぀-ヿ㄰-㆏㐀-䶿一-鿿가-힯]+/gu;
+const WORD_SEPARATOR = /[^\p{L}\p{N}]+/u;
+const NGRAM_SIZE = 2;
+
+const ngrams = (run) => {
+  if (run.length <= NGRAM_SIZE) return [run];
+  const grams = [];
+  for (let i = 0; i <= run.length - NGRAM_SIZE; i += 1) {
+    grams.push(run.slice(i, i + NGRAM_SIZE));
+  }
+  return grams;
+};
+
+const tokenizeWord = (word, unigrams) => {
+  const tokens = [];
+  let last = 0;
+  for (const match of word.matchAll(CJK_RUN)) {
+    if (match.index > last) tokens.push(word.slice(last, match.index));
+    tokens.push(...ngrams(match[0]));
+    if (unigrams && match[0].length > 1) tokens.push(...match[0]);
+    last = match.index + match[0].length;
+  }
+  if (last < word.length) tokens.push(word.slice(last));
+  return tokens;
+};
+
+// Query tokens; `unigrams` adds single CJK characters for stored tokens
+export const tokenize = (text = '', { unigrams = false } = {}) => {
+  const tokens = new Set();
+  for (const word of text.normalize('NFKC').toLowerCase().split(WORD_SEPARATOR)) {
+    if (!word) continue;
+    for (const token of tokenizeWord(word, unigrams)) tokens.add(token);
+  }
+  return [...tokens];
+};
+
+// Tokens stored on a task, covering every searchable field
+export const buildSearchTokens = ({ title, description, tags, category }) =>
+  tokenize([title, category, ...(tags ?? []), description].filter(Boolean).join(' '), { unigrams: true });
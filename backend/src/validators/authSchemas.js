@@ -0,0 +1,26 @@
+import Joi from 'joi';
+
+const email = Joi.string().trim().lowercase().email().max(254);
+
+// bcrypt only uses the first 72 bytes of a password. The limit is on UTF-8
+// bytes, not characters: a Korean password reaches it at 24 characters.
+export const MAX_PASSWORD_BYTES = 72;
+
+const password = Joi.string()
+  .custom((value, helpers) =>
+    Buffer.byteLength(value, 'utf8') > MAX_PASSWORD_BYTES
+      ? helpers.error('string.maxBytes', { limit: MAX_PASSWORD_BYTES })
+      : value
+  )
+  .messages({ 'string.maxBytes': '{{#label}} must be at most {{#limit}} bytes' });
+
+export const signupBodySchema = Joi.object({
+  email: email.required(),
+  name: Joi.string().trim().min(1).max(50).required(),
+  password: password.min(8).required()
+});
+
+export const loginBodySchema = Joi.object({
+  email: email.required(),
+  password: password.required()
+});
@@ -0,0 +1,9 @@
+import Joi from 'joi';
+
+export const MAX_SYNC_PAGE_SIZE = 1000;
+
+export const syncQuerySchema = Joi.object({
+  since: Joi.number().integer().min(0).default(0),
+  cursor: Joi.string().max(512),
+  limit: Joi.number().integer().min(1).max(MAX_SYNC_PAGE_SIZE).default(500)
+});
@@ -0,0 +1,91 @@
+import Joi from 'joi';
+
+export const MAX_PAGE_SIZE = 100;
+export const MAX_STREAM_PAGE_SIZE = 5000;
+export const MAX_BULK_OPERATIONS = 1000;
+// A create with every field at its maximum length serializes to about
+// 11.6 kB when the text is Korean (3 UTF-8 bytes per character), so a full
+// batch of them stays under this request body limit.
+export const MAX_BULK_BODY_BYTES = 12 * 1024 * 1024;
+export const MAX_SEARCH_PAGE_SIZE = 50;
+export const MAX_SEARCH_RESULTS = 1000;
+
+const objectId = Joi.string().hex().length(24);
+const tag = Joi.string().trim().max(30);
+
+export const listQuerySchema = Joi.object({
+  cursor: Joi.string().max(512),
+  stream: Joi.boolean().default(false),
+  limit: Joi.number()
+    .integer()
+    .min(1)
+    .default(20)
+    .when('stream', {
+      is: true,
+      then: Joi.number().max(MAX_STREAM_PAGE_SIZE),
+      otherwise: Joi.number().max(MAX_PAGE_SIZE)
+    }),
+  sortBy: Joi.string().valid('createdAt', 'dueDate').default('createdAt'),
+  order: Joi.string().valid('asc', 'desc').default('desc'),
+  completed: Joi.boolean()
+});
+
+export const searchQuerySchema = Joi.object({
+  q: Joi.string().trim().min(1).max(200).required(),
+  tag,
+  category: Joi.string().trim().max(50),
+  completed: Joi.boolean(),
+  limit: Joi.number().integer().min(1).max(MAX_SEARCH_PAGE_SIZE).default(20),
+  // Ranked results are paged by number, so deep pages are capped
+  page: Joi.number()
+    .integer()
+    .min(1)
+    .max(Joi.ref('limit', { adjust: (limit) => Math.floor(MAX_SEARCH_RESULTS / limit) }))
+    .default(1)
+});
+
+const taskFields = {
+  title: Joi.string().trim().min(1).max(200),
+  description: Joi.string().allow('').max(2000),
+  dueDate: Joi.date().allow(null),
+  priority: Joi.string().valid('low', 'medium', 'high'),
+  tags: Joi.array().items(tag).max(50),
+  category: Joi.string().trim().allow('').max(50),
+  isCompleted: Joi.boolean()
+};
+
+const bulkOperationSchema = Joi.object({
+  op: Joi.string().valid('create', 'update', 'complete', 'delete', 'retag').required()
+})
+  .when(Joi.object({ op: 'create' }).unknown(), {
+    then: Joi.object({
+      // Optional client-generated id, so offline clients can reference the task before it syncs
+      id: objectId,
+      task: Joi.object(taskFields).fork('title', (field) => field.required()).required()
+    })
+  })
+  .when(Joi.object({ op: 'update' }).unknown(), {
+    then: Joi.object({ id: objectId.required(), changes: Joi.object(taskFields).min(1).required() })
+  })
+  .when(Joi.object({ op: 'complete' }).unknown(), {
+    then: Joi.object({ id: objectId.required(), isCompleted: Joi.boolean().default(true) })
+  })
+  .when(Joi.object({ op: 'delete' }).unknown(), {
+    then: Joi.object({ id: objectId.required() })
+  })
+  .when(Joi.object({ op: 'retag' }).unknown(), {
+    then: Joi.object({
+      id: objectId.required(),
+      tags: Joi.array().items(tag).max(50),
+      addTags: Joi.array().items(tag).max(50),
+      removeTags: Joi.array().items(tag).max(50),
+      category: Joi.string().trim().allow('', null).max(50)
+    })
+      .or('tags', 'addTags', 'removeTags', 'category')
+      .oxor('tags', 'addTags')
+      .oxor('tags', 'removeTags')
+  });
+
+export const bulkBodySchema = Joi.object({
+  operations: Joi.array().items(bulkOperationSchema).min(1).max(MAX_BULK_OPERATIONS).required()
+});
@@ -0,0 +1,17 @@
+import { parentPort } from 'node:worker_threads';
+import bcrypt from 'bcrypt';
+
+// bcrypt runs synchronously here: the worker thread is the unit of
+// concurrency, so the libuv threadpool stays free for fs/dns/crypto.
+const operations = {
+  hash: ([password, cost]) => bcrypt.hashSync(password, cost),
+  compare: ([password, hash]) => bcrypt.compareSync(password, hash)
+};
+
+parentPort.on('message', ({ id, op, args }) => {
+  try {
+    parentPort.postMessage({ id, result: operations[op](args) });
+  } catch (err) {
+    parentPort.postMessage({ id, error: err.message });
+  }
+});
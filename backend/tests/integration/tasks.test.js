@@ -0,0 +1,91 @@
+import { jest } from '@jest/globals';
+import jwt from 'jsonwebtoken';
+import request from 'supertest';
+
+const USER = '0123456789abcdef01234567';
+process.env.JWT_SECRET = 'integration-test-secret';
+
+// The HTTP layer only; the bulk write itself is covered by the unit tests
+const bulkMutateTasks = jest.fn(async (userId, operations) => ({
+  results: operations.map(({ op, id }) => ({ op, id, status: 'ok' })),
+  summary: { inserted: operations.length, modified: 0, deleted: 0, failed: 0, notFound: 0 }
+}));
+
+jest.unstable_mockModule('../../src/services/taskService.js', () => ({
+  bulkMutateTasks,
+  getTaskCounts: jest.fn(),
+  listTasks: jest.fn(),
+  streamTasks: jest.fn()
+}));
+
+const { default: app } = await import('../../src/app.js');
+const { httpRequestDuration } = await import('../../src/config/metrics.js');
+const { MAX_BULK_OPERATIONS } = await import('../../src/validators/taskSchemas.js');
+
+const token = jwt.sign({ id: USER }, process.env.JWT_SECRET, { expiresIn: '1h' });
+
+// Every field at its maximum length, in 3-byte UTF-8 characters
+const text = (length) => '가'.repeat(length);
+const maximalCreate = () => ({
+  op: 'create',
+  task: {
+    title: text(200),
+    description: text(2000),
+    dueDate: '2026-12-31T00:00:00.000Z',
+    priority: 'high',
+    tags: Array.from({ length: 50 }, (_, index) => `${index}`.padEnd(30, '가')),
+    category: text(50),
+    isCompleted: false
+  }
+});
+
+describe('POST /api/tasks/bulk', () => {
+  it(`accepts ${MAX_BULK_OPERATIONS} maximal operations in one request`, async () => {
+    const operations = Array.from({ length: MAX_BULK_OPERATIONS }, maximalCreate);
+
+    const res = await request(app)
+      .post('/api/tasks/bulk')
+      .set('Authorization', `Bearer ${token}`)
+      .send({ operations });
+
+    expect(res.status).toBe(200);
+    expect(res.body.results).toHaveLength(MAX_BULK_OPERATIONS);
+    expect(bulkMutateTasks).toHaveBeenCalledTimes(1);
+  });
+
+  it('rejects a batch above the operation cap with 400', async () => {
+    const operations = Array.from({ length: MAX_BULK_OPERATIONS + 1 }, () => ({ op: 'create', task: { title: 'x' } }));
+
+    const res = await request(app)
+      .post('/api/tasks/bulk')
+      .set('Authorization', `Bearer ${token}`)
+      .send({ operations });
+
+    expect(res.status).toBe(400);
+  });
+});
+
+describe('request metrics', () => {
+  // Durations are recorded on the response's `finish` event
+  const routesFor = async (status) => {
+    await new Promise((resolve) => setImmediate(resolve));
+    return [...httpRequestDuration.series.values()]
+      .filter(({ labels }) => labels.status === status)
+      .map(({ labels }) => labels.route);
+  };
+
+  it('labels validation errors with the full route template', async () => {
+    await request(app).get('/api/tasks?limit=1000').set('Authorization', `Bearer ${token}`).expect(400);
+    await request(app).post('/api/tasks/bulk').set('Authorization', `Bearer ${token}`).send({}).expect(400);
+
+    const routes = await routesFor(400);
+    expect(routes).toEqual(expect.arrayContaining(['/api/tasks/', '/api/tasks/bulk']));
+    expect(routes).not.toContain('/');
+  });
+
+  it('labels requests rejected before a route matched with the router mount path', async () => {
+    await request(app).get('/api/sync').expect(401);
+
+    expect(await routesFor(401)).toEqual(['/api/sync/*']);
+  });
+});
@@ -0,0 +1,20 @@
+import { loginBodySchema, signupBodySchema } from '../../src/validators/authSchemas.js';
+
+const signup = (password) => signupBodySchema.validate({ email: 'a@example.com', name: 'A', password });
+
+describe('password length', () => {
+  it('accepts up to 72 bytes', () => {
+    expect(signup('a'.repeat(72)).error).toBeUndefined();
+    expect(signup('가'.repeat(24)).error).toBeUndefined();
+  });
+
+  it('rejects passwords bcrypt would truncate, counting UTF-8 bytes', () => {
+    expect(signup('a'.repeat(73)).error?.details[0].type).toBe('string.maxBytes');
+    expect(signup('가'.repeat(25)).error?.details[0].type).toBe('string.maxBytes');
+    expect(loginBodySchema.validate({ email: 'a@example.com', password: '가'.repeat(25) }).error).toBeDefined();
+  });
+
+  it('still enforces the minimum length on signup', () => {
+    expect(signup('short').error?.details[0].type).toBe('string.min');
+  });
+});
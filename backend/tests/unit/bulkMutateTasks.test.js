@@ -0,0 +1,128 @@
+import { jest } from '@jest/globals';
+
+const USER = '0123456789abcdef01234567';
+const ID = '89abcdef0123456789abcdef';
+const DUPLICATE_KEY = 11000;
+
+// In-memory stand-in for the tasks collection. `landing` holds documents that
+// another request stores just before this batch's bulkWrite runs.
+const stored = new Map();
+const landing = new Map();
+const bulkWrites = [];
+
+const query = (rows) => {
+  const chain = { select: () => chain, lean: () => Promise.resolve(rows) };
+  return chain;
+};
+
+const Task = {
+  find: ({ _id, userId, syncVersion }) =>
+    query(
+      [...stored.values()].filter(
+        (task) =>
+          _id.$in.map(String).includes(String(task._id)) &&
+          String(task.userId) === String(userId) &&
+          (!syncVersion || task.syncVersion >= syncVersion.$gte)
+      )
+    ),
+  bulkWrite: async (writes) => {
+    bulkWrites.push(writes);
+    for (const [id, task] of landing) stored.set(id, task);
+    landing.clear();
+
+    const result = { insertedCount: 0, matchedCount: 0, modifiedCount: 0, deletedCount: 0 };
+    const writeErrors = [];
+    writes.forEach((write, index) => {
+      if (write.insertOne) {
+        const { document } = write.insertOne;
+        if (stored.has(String(document._id))) {
+          writeErrors.push({ index, code: DUPLICATE_KEY, errmsg: 'E11000 duplicate key error' });
+          return;
+        }
+        stored.set(String(document._id), { ...document });
+        result.insertedCount += 1;
+      } else if (write.updateOne) {
+        const task = stored.get(String(write.updateOne.filter._id));
+        if (!task) return;
+        Object.assign(task, write.updateOne.update.$set);
+        result.matchedCount += 1;
+        result.modifiedCount += 1;
+      }
+    });
+    if (writeErrors.length) throw Object.assign(new Error('bulk write failed'), { writeErrors, result });
+    return result;
+  }
+};
+
+jest.unstable_mockModule('../../src/models/Task.js', () => ({ default: Task, LIST_PROJECTION: '-__v' }));
+jest.unstable_mockModule('../../src/models/TaskTombstone.js', () => ({
+  default: { find: () => query([]), insertMany: async () => {} },
+  TOMBSTONE_RETENTION_DAYS: 90
+}));
+jest.unstable_mockModule('../../src/models/TaskFacet.js', () => ({
+  default: { bulkWrite: async () => {}, deleteMany: async () => {} }
+}));
+jest.unstable_mockModule('../../src/services/syncService.js', () => ({
+  beginSyncWrite: async () => 7,
+  endSyncWrite: async () => {}
+}));
+
+const { bulkMutateTasks } = await import('../../src/services/taskService.js');
+
+// The outbox replays a create whose first response was lost, plus later edits
+const replay = [
+  { op: 'create', id: ID, task: { title: 'Buy oat milk' } },
+  { op: 'complete', id: ID, isCompleted: true },
+  { op: 'update', id: ID, changes: { title: 'Buy oat milk (2L)' } }
+];
+const firstAttempt = { _id: ID, userId: USER, title: 'Buy oat milk', isCompleted: false, syncVersion: 6 };
+
+describe('bulkMutateTasks', () => {
+  beforeEach(() => {
+    stored.clear();
+    landing.clear();
+    bulkWrites.length = 0;
+  });
+
+  it('applies the edits of a retried create to the stored task', async () => {
+    stored.set(ID, { ...firstAttempt });
+
+    const { results } = await bulkMutateTasks(USER, replay);
+
+    expect(results.map((result) => result.status)).toEqual(['exists', 'ok', 'ok']);
+    expect(bulkWrites).toHaveLength(1);
+    expect(bulkWrites[0]).toHaveLength(1);
+    expect(bulkWrites[0][0].updateOne).toBeDefined();
+    expect(stored.get(ID)).toMatchObject({ title: 'Buy oat milk (2L)', isCompleted: true });
+  });
+
+  it('applies the edits when the create lands between the read and the write', async () => {
+    landing.set(ID, { ...firstAttempt });
+
+    const { results } = await bulkMutateTasks(USER, replay);
+
+    expect(results.map((result) => result.status)).toEqual(['exists', 'ok', 'ok']);
+    expect(bulkWrites).toHaveLength(2);
+    expect(bulkWrites[1][0].updateOne).toBeDefined();
+    expect(stored.get(ID)).toMatchObject({ title: 'Buy oat milk (2L)', isCompleted: true });
+  });
+
+  it('inserts a create and its edits as one document when nothing is stored', async () => {
+    const { results, summary } = await bulkMutateTasks(USER, replay);
+
+    expect(results.map((result) => result.status)).toEqual(['ok', 'ok', 'ok']);
+    expect(summary.inserted).toBe(1);
+    expect(bulkWrites).toHaveLength(1);
+    expect(bulkWrites[0][0].insertOne).toBeDefined();
+    expect(stored.get(ID)).toMatchObject({ title: 'Buy oat milk (2L)', isCompleted: true });
+  });
+
+  it("reports edits folded into a create of another user's id as not_found", async () => {
+    landing.set(ID, { ...firstAttempt, userId: 'fedcba9876543210fedcba98' });
+
+    const { results } = await bulkMutateTasks(USER, replay);
+
+    expect(results.map((result) => result.status)).toEqual(['exists', 'not_found', 'not_found']);
+    expect(stored.get(ID).title).toBe('Buy oat milk');
+  });
+});
@@ -0,0 +1,122 @@
+import { coalesceOperations, mergeTags, normalizeOperation } from '../../src/utils/bulkOperations.js';
+
+const ID = '0123456789abcdef01234567';
+const OTHER = '89abcdef0123456789abcdef';
+
+describe('mergeTags', () => {
+  it('keeps existing order, appends new tags and lets removals win', () => {
+    expect(mergeTags(['a', 'b'], ['c', 'a', 'd'], ['b', 'd'])).toEqual(['a', 'c']);
+  });
+});
+
+describe('normalizeOperation', () => {
+  it('turns complete and retag into updates', () => {
+    expect(normalizeOperation({ op: 'complete', id: ID, isCompleted: false })).toEqual({
+      op: 'update',
+      id: ID,
+      changes: { isCompleted: false }
+    });
+    expect(normalizeOperation({ op: 'retag', id: ID, addTags: ['x'], category: 'Work' })).toEqual({
+      op: 'update',
+      id: ID,
+      changes: { category: 'Work' },
+      addTags: ['x'],
+      removeTags: []
+    });
+  });
+});
+
+describe('coalesceOperations', () => {
+  it('folds an edit of a task created in the same batch into the create', () => {
+    const { entries, dropped } = coalesceOperations([
+      { op: 'create', id: ID, task: { title: 'Draft', tags: ['a'] } },
+      { op: 'update', id: ID, changes: { title: 'Final' } },
+      { op: 'complete', id: ID, isCompleted: true },
+      { op: 'retag', id: ID, addTags: ['b'], removeTags: ['a'] }
+    ]);
+
+    expect(dropped).toEqual([]);
+    expect(entries).toHaveLength(1);
+    expect(entries[0].indexes).toEqual([0, 1, 2, 3]);
+    expect(entries[0].operation).toEqual({
+      op: 'create',
+      id: ID,
+      task: { title: 'Final', tags: ['b'], isCompleted: true },
+      edits: {
+        op: 'update',
+        id: ID,
+        changes: { title: 'Final', isCompleted: true },
+        addTags: ['b'],
+        removeTags: ['a']
+      }
+    });
+  });
+
+  it('turns create then delete into a delete of a task that may never have been stored', () => {
+    const { entries } = coalesceOperations([
+      { op: 'create', id: ID, task: { title: 'Oops' } },
+      { op: 'delete', id: ID }
+    ]);
+
+    expect(entries).toHaveLength(1);
+    expect(entries[0].indexes).toEqual([0, 1]);
+    expect(entries[0].operation).toEqual({ op: 'delete', id: ID, created: true });
+  });
+
+  it('merges repeated edits of an existing task into one update', () => {
+    const { entries } = coalesceOperations([
+      { op: 'update', id: ID, changes: { title: 'One', priority: 'low' } },
+      { op: 'retag', id: ID, addTags: ['x', 'y'] },
+      { op: 'retag', id: ID, removeTags: ['x', 'z'] },
+      { op: 'update', id: ID, changes: { title: 'Two' } }
+    ]);
+
+    expect(entries).toHaveLength(1);
+    expect(entries[0].operation).toEqual({
+      op: 'update',
+      id: ID,
+      changes: { title: 'Two', priority: 'low' },
+      addTags: ['y'],
+      removeTags: ['x', 'z']
+    });
+  });
+
+  it('applies tag changes after a full tag list to that list', () => {
+    const { entries } = coalesceOperations([
+      { op: 'retag', id: ID, tags: ['a', 'b'] },
+      { op: 'retag', id: ID, addTags: ['c'], removeTags: ['a'] }
+    ]);
+
+    expect(entries[0].operation).toEqual({
+      op: 'update',
+      id: ID,
+      changes: { tags: ['b', 'c'] },
+      addTags: [],
+      removeTags: []
+    });
+  });
+
+  it('drops operations that follow a delete of the same task', () => {
+    const { entries, dropped } = coalesceOperations([
+      { op: 'update', id: ID, changes: { title: 'Gone soon' } },
+      { op: 'delete', id: ID },
+      { op: 'update', id: ID, changes: { title: 'Too late' } }
+    ]);
+
+    expect(entries).toHaveLength(1);
+    expect(entries[0].operation).toEqual({ op: 'delete', id: ID, created: false });
+    expect(entries[0].indexes).toEqual([0, 1]);
+    expect(dropped).toEqual([2]);
+  });
+
+  it('keeps operations on different tasks and creates without ids separate', () => {
+    const { entries } = coalesceOperations([
+      { op: 'create', task: { title: 'A' } },
+      { op: 'create', task: { title: 'B' } },
+      { op: 'complete', id: ID, isCompleted: true },
+      { op: 'delete', id: OTHER }
+    ]);
+
+    expect(entries.map((entry) => entry.indexes)).toEqual([[0], [1], [2], [3]]);
+  });
+});
@@ -0,0 +1,75 @@
+import mongoose from 'mongoose';
+import { buildKeysetFilter, decodeCursor, encodeCursor } from '../../src/utils/cursor.js';
+
+const id = new mongoose.Types.ObjectId();
+
+const errorOf = (fn) => {
+  try {
+    fn();
+  } catch (err) {
+    return err;
+  }
+  return null;
+};
+
+describe('encodeCursor / decodeCursor', () => {
+  it('round-trips a date sort key', () => {
+    const createdAt = new Date('2025-01-02T03:04:05.000Z');
+    const cursor = encodeCursor({ _id: id, createdAt }, 'createdAt', 'desc');
+
+    const decoded = decodeCursor(cursor, 'createdAt', 'desc');
+    expect(decoded.value).toEqual(createdAt);
+    expect(String(decoded.id)).toBe(String(id));
+  });
+
+  it('round-trips numeric and missing sort keys', () => {
+    expect(decodeCursor(encodeCursor({ _id: id, syncVersion: 7 }, 'syncVersion', 'asc'), 'syncVersion', 'asc').value).toBe(7);
+    expect(decodeCursor(encodeCursor({ _id: id }, 'dueDate', 'asc'), 'dueDate', 'asc').value).toBeNull();
+  });
+
+  it('rejects a cursor issued for another sort', () => {
+    const cursor = encodeCursor({ _id: id, createdAt: new Date() }, 'createdAt', 'desc');
+    expect(() => decodeCursor(cursor, 'createdAt', 'asc')).toThrow('Cursor does not match the requested sort');
+    expect(() => decodeCursor(cursor, 'dueDate', 'desc')).toThrow('Cursor does not match the requested sort');
+  });
+
+  it('rejects malformed cursors with a 400', () => {
+    const encode = (payload) => Buffer.from(JSON.stringify(payload)).toString('base64url');
+
+    for (const cursor of [
+      'not-base64-json',
+      encode(null),
+      encode({ s: 'createdAt', o: 'desc', v: null, id: 'nope' }),
+      encode({ s: 'createdAt', o: 'desc', v: 'not a date', d: 1, id: String(id) }),
+      encode({ s: 'createdAt', o: 'desc', v: '2025-01-01', id: String(id) })
+    ]) {
+      expect(errorOf(() => decodeCursor(cursor, 'createdAt', 'desc'))).toMatchObject({ statusCode: 400 });
+    }
+  });
+});
+
+describe('buildKeysetFilter', () => {
+  const due = new Date('2025-06-01T00:00:00.000Z');
+
+  it('descending on a value also continues into the trailing null rows', () => {
+    expect(buildKeysetFilter('dueDate', 'desc', { value: due, id })).toEqual({
+      $or: [{ dueDate: { $lt: due } }, { dueDate: due, _id: { $lt: id } }, { dueDate: null }]
+    });
+  });
+
+  it('ascending on a value never goes back to null rows', () => {
+    expect(buildKeysetFilter('dueDate', 'asc', { value: due, id })).toEqual({
+      $or: [{ dueDate: { $gt: due } }, { dueDate: due, _id: { $gt: id } }]
+    });
+  });
+
+  it('ascending from a null row continues through the remaining nulls, then every value', () => {
+    expect(buildKeysetFilter('dueDate', 'asc', { value: null, id })).toEqual({
+      $or: [{ dueDate: null, _id: { $gt: id } }, { dueDate: { $ne: null } }]
+    });
+  });
+
+  it('descending from a null row only has the remaining nulls left', () => {
+    expect(buildKeysetFilter('dueDate', 'desc', { value: null, id })).toEqual({ dueDate: null, _id: { $lt: id } });
+  });
+});
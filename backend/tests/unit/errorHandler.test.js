@@ -0,0 +1,46 @@
+import { jest } from '@jest/globals';
+import { errorHandler } from '../../src/middleware/errorHandler.js';
+import { ApiError } from '../../src/utils/ApiError.js';
+
+const response = () => {
+  const res = { headersSent: false };
+  res.status = jest.fn(() => res);
+  res.json = jest.fn(() => res);
+  return res;
+};
+
+// Shape of the errors body-parser raises (http-errors)
+const clientError = (status, message) => Object.assign(new Error(message), { status, statusCode: status, expose: true });
+
+describe('errorHandler', () => {
+  it('renders an ApiError with its status and details', () => {
+    const res = response();
+    errorHandler(ApiError.badRequest('Validation failed', ['"title" is required']), {}, res, jest.fn());
+
+    expect(res.status.mock.calls[0]).toEqual([400]);
+    expect(res.json.mock.calls[0]).toEqual([{ error: 'Validation failed', details: ['"title" is required'] }]);
+  });
+
+  it('passes through exposed client errors such as malformed JSON and oversized bodies', () => {
+    for (const [status, message] of [
+      [400, 'Unexpected token } in JSON at position 12'],
+      [413, 'request entity too large']
+    ]) {
+      const res = response();
+      errorHandler(clientError(status, message), {}, res, jest.fn());
+
+      expect(res.status.mock.calls[0]).toEqual([status]);
+      expect(res.json.mock.calls[0]).toEqual([{ error: message }]);
+    }
+  });
+
+  it('hides unexpected errors behind a 500', () => {
+    const res = response();
+    const error = jest.spyOn(console, 'error').mockImplementation(() => {});
+    errorHandler(new Error('connection reset'), {}, res, jest.fn());
+    error.mockRestore();
+
+    expect(res.status.mock.calls[0]).toEqual([500]);
+    expect(res.json.mock.calls[0][0].error).toBe('Something went wrong!');
+  });
+});
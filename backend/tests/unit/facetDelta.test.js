@@ -0,0 +1,45 @@
+import { facetDelta, mergeFacetDeltas } from '../../src/services/searchService.js';
+
+const entries = (delta) => Object.fromEntries([...delta].map(([key, value]) => [key.replace('\u0000', ':'), value]));
+
+describe('facetDelta', () => {
+  it('counts every tag and the category of a created task once', () => {
+    expect(entries(facetDelta(null, { tags: ['work', 'work', 'q3'], category: 'Team' }))).toEqual({
+      'tag:work': 1,
+      'tag:q3': 1,
+      'category:Team': 1
+    });
+  });
+
+  it('reverses the contribution of a deleted task', () => {
+    expect(entries(facetDelta({ tags: ['work'], category: 'Team' }, null))).toEqual({
+      'tag:work': -1,
+      'category:Team': -1
+    });
+  });
+
+  it('only reports what changed between two snapshots', () => {
+    const before = { tags: ['work', 'q2'], category: 'Team' };
+    const after = { tags: ['work', 'q3'], category: 'Team' };
+    expect(entries(facetDelta(before, after))).toEqual({ 'tag:q2': -1, 'tag:q3': 1 });
+  });
+
+  it('ignores an empty category', () => {
+    expect(entries(facetDelta(null, { tags: [], category: '' }))).toEqual({});
+  });
+});
+
+describe('mergeFacetDeltas', () => {
+  it('sums the deltas of a batch per facet', () => {
+    const merged = mergeFacetDeltas([
+      facetDelta(null, { tags: ['work'], category: 'Team' }),
+      facetDelta(null, { tags: ['work', 'home'] }),
+      facetDelta({ tags: ['home'], category: 'Team' }, null)
+    ]);
+    expect(entries(merged)).toEqual({ 'tag:work': 2, 'tag:home': 0, 'category:Team': 0 });
+  });
+
+  it('returns an empty delta for an empty batch', () => {
+    expect(mergeFacetDeltas([]).size).toBe(0);
+  });
+});
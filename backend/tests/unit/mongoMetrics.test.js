@@ -0,0 +1,26 @@
+import { EventEmitter } from 'node:events';
+import { mongoCommandDuration } from '../../src/config/metrics.js';
+import { instrumentMongoClient } from '../../src/utils/mongoMetrics.js';
+
+const client = new EventEmitter();
+instrumentMongoClient(client);
+
+const run = (requestId, commandName, command) => {
+  client.emit('commandStarted', { requestId, commandName, command });
+  client.emit('commandSucceeded', { requestId, commandName, duration: 1 });
+};
+
+const seriesLabels = () => [...mongoCommandDuration.series.values()].map(({ labels }) => labels);
+
+describe('instrumentMongoClient', () => {
+  it('labels getMore with the collection, not the cursor id', () => {
+    run(1, 'find', { find: 'tasks', filter: {} });
+    run(2, 'getMore', { getMore: 8123456789012345678n, collection: 'tasks' });
+    run(3, 'getMore', { getMore: 9123456789012345678n, collection: 'tasks' });
+
+    expect(seriesLabels()).toEqual([
+      { collection: 'tasks', command: 'find' },
+      { collection: 'tasks', command: 'getMore' }
+    ]);
+  });
+});
@@ -0,0 +1,96 @@
+import { jest } from '@jest/globals';
+import { MemoryStore } from '../../src/cache/MemoryStore.js';
+import { QueryCache } from '../../src/cache/QueryCache.js';
+
+describe('MemoryStore', () => {
+  afterEach(() => {
+    jest.useRealTimers();
+  });
+
+  it('evicts the least recently used entry once over maxEntries', async () => {
+    const store = new MemoryStore({ maxEntries: 2 });
+    await store.set('a', 1);
+    await store.set('b', 2);
+    await store.get('a'); // a is now more recent than b
+    await store.set('c', 3);
+
+    expect(store.size).toBe(2);
+    expect(await store.get('b')).toBeUndefined();
+    expect(await store.get('a')).toBe(1);
+    expect(await store.get('c')).toBe(3);
+  });
+
+  it('expires entries after their TTL and keeps entries without one', async () => {
+    jest.useFakeTimers();
+    const store = new MemoryStore();
+    await store.set('short', 'x', 1000);
+    await store.set('forever', 'y');
+
+    jest.advanceTimersByTime(999);
+    expect(await store.get('short')).toBe('x');
+
+    jest.advanceTimersByTime(1);
+    expect(await store.get('short')).toBeUndefined();
+    expect(await store.get('forever')).toBe('y');
+    expect(store.size).toBe(1);
+  });
+});
+
+describe('QueryCache', () => {
+  const createCache = (options = {}) =>
+    new QueryCache(new MemoryStore(), { namespace: 'tasks', ttlMs: 30_000, ...options });
+
+  it('serves repeated queries from the cache regardless of key order', async () => {
+    const cache = createCache();
+    const load = jest.fn(async () => ['task']);
+
+    await cache.wrap('u1', 'list', { limit: 20, order: 'desc' }, load);
+    const value = await cache.wrap('u1', 'list', { order: 'desc', limit: 20, cursor: undefined }, load);
+
+    expect(value).toEqual(['task']);
+    expect(load).toHaveBeenCalledTimes(1);
+  });
+
+  it('shares one load between concurrent misses', async () => {
+    const cache = createCache();
+    const load = jest.fn(async () => 42);
+
+    const values = await Promise.all([cache.wrap('u1', 'counts', {}, load), cache.wrap('u1', 'counts', {}, load)]);
+
+    expect(values).toEqual([42, 42]);
+    expect(load).toHaveBeenCalledTimes(1);
+  });
+
+  it('invalidating a user drops only that user\'s entries', async () => {
+    const cache = createCache();
+    const load = jest.fn(async () => 'value');
+
+    await cache.wrap('u1', 'list', {}, load);
+    await cache.wrap('u2', 'list', {}, load);
+    await cache.invalidate('u1');
+    await cache.wrap('u1', 'list', {}, load);
+    await cache.wrap('u2', 'list', {}, load);
+
+    expect(load).toHaveBeenCalledTimes(3);
+  });
+
+  it('stays correct when the version stamp itself is evicted', async () => {
+    const cache = new QueryCache(new MemoryStore({ maxEntries: 1 }), { namespace: 'tasks', ttlMs: 30_000 });
+    const load = jest.fn(async () => 'value');
+
+    await cache.wrap('u1', 'list', {}, load);
+    await cache.wrap('u1', 'list', {}, load);
+
+    expect(load).toHaveBeenCalledTimes(2);
+  });
+
+  it('always loads when disabled', async () => {
+    const cache = createCache({ enabled: false });
+    const load = jest.fn(async () => 'value');
+
+    await cache.wrap('u1', 'list', {}, load);
+    await cache.wrap('u1', 'list', {}, load);
+
+    expect(load).toHaveBeenCalledTimes(2);
+  });
+});
@@ -0,0 +1,46 @@
+import { buildSearchTokens, tokenize } from '../../src/utils/searchTokens.js';
+
+describe('tokenize', () => {
+  it('splits Korean runs into overlapping bigrams', () => {
+    expect(tokenize('회의록을 작성')).toEqual(['회의', '의록', '록을', '작성']);
+  });
+
+  it('keeps short Korean runs whole', () => {
+    expect(tokenize('밥')).toEqual(['밥']);
+    expect(tokenize('점심')).toEqual(['점심']);
+  });
+
+  it('lowercases other scripts and splits mixed words at script boundaries', () => {
+    expect(tokenize('API문서 Review!')).toEqual(['api', '문서', 'review']);
+  });
+
+  it('normalizes full-width and decomposed input', () => {
+    expect(tokenize('ＡＰＩ')).toEqual(['api']);
+    expect(tokenize('회의'.normalize('NFD'))).toEqual(['회의']);
+  });
+
+  it('drops duplicate tokens and punctuation', () => {
+    expect(tokenize('회의, 회의... meeting meeting')).toEqual(['회의', 'meeting']);
+    expect(tokenize('--- !!!')).toEqual([]);
+  });
+});
+
+describe('buildSearchTokens', () => {
+  it('covers every searchable field', () => {
+    const tokens = buildSearchTokens({ title: 'Weekly', description: '회의록', tags: ['work'], category: 'Team' });
+    expect(tokens).toEqual(expect.arrayContaining(['weekly', 'team', 'work', '회의', '의록']));
+  });
+
+  it('also stores single Korean characters so one-character queries match', () => {
+    const tokens = buildSearchTokens({ title: '점심밥 먹기' });
+    expect(tokens).toEqual(expect.arrayContaining(tokenize('밥')));
+    expect(tokens).toEqual(expect.arrayContaining(tokenize('점심밥')));
+  });
+
+  it('keeps terms at the end of a long description searchable', () => {
+    const filler = Array.from({ length: 1500 }, (_, i) => `w${i}`).join(' ');
+    const tokens = buildSearchTokens({ title: 'Long', description: `${filler} 마지막` });
+    expect(tokens).toContain('마지');
+    expect(tokens).toContain('w1499');
+  });
+});
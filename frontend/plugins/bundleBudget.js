@@ -0,0 +1,62 @@
+import { Buffer } from 'node:buffer'
+import { gzipSync } from 'node:zlib'
+
+const KB = 1024
+
+const formatKb = (bytes) => `${(bytes / KB).toFixed(1)} kB`
+
+// Chunks are matched by their exact Rollup name (`index`, `react`,
+// `LoginPage`) and assets by their source name (`index.css`), never by file
+// name prefix: a shared chunk such as react-hook-form's `index.esm` is not the
+// `index` entry.
+const outputName = (output) => (output.type === 'chunk' ? output.name : (output.names?.[0] ?? output.name))
+
+/**
+ * Reports the gzip size of every emitted JS/CSS file against a budget (in kB,
+ * keyed by chunk or asset name) and fails the build if any file is over,
+ * unless `failOnExceed` is false.
+ */
+export function bundleBudget({ budgets = {}, defaultBudget = 50, failOnExceed = true } = {}) {
+  return {
+    name: 'bundle-budget',
+    apply: 'build',
+    generateBundle(_options, bundle) {
+      const rows = []
+
+      for (const output of Object.values(bundle)) {
+        if (!/\.(js|css)$/.test(output.fileName)) continue
+        const source = output.type === 'chunk' ? output.code : output.source
+        const gzip = gzipSync(source).length
+        const name = outputName(output)
+        const budget = (budgets[name] ?? defaultBudget) * KB
+        rows.push({ file: `${output.fileName} (${name})`, size: Buffer.byteLength(source), gzip, budget, over: gzip > budget })
+      }
+
+      rows.sort((a, b) => b.gzip - a.gzip)
+      const width = Math.max(...rows.map((row) => row.file.length), 4)
+
+      const lines = rows.map(
+        (row) =>
+          `${row.over ? '✗' : '✓'} ${row.file.padEnd(width)}  ${formatKb(row.size).padStart(10)}  ` +
+          `${formatKb(row.gzip).padStart(10)} / ${formatKb(row.budget)}`
+      )
+      this.info(
+        [`\nBundle budget (gzip)`, `  ${'file'.padEnd(width)}  ${'raw'.padStart(10)}  ${'gzip'.padStart(10)}`, ...lines].join(
+          '\n'
+        )
+      )
+
+      const over = rows.filter((row) => row.over)
+      if (over.length === 0) return
+
+      const summary = over
+        .map((row) => `${row.file} is ${formatKb(row.gzip)} gzip (budget ${formatKb(row.budget)})`)
+        .join('; ')
+      if (failOnExceed) {
+        this.error(`Bundle budget exceeded: ${summary}`)
+      } else {
+        this.warn(`Bundle budget exceeded: ${summary}`)
+      }
+    },
+  }
+}
@@ -1,33 +1,80 @@
-function App() {
+import { Suspense } from 'react'
+import { BrowserRouter, Link, Navigate, Route, Routes } from 'react-router-dom'
+import RequireAuth from './routes/RequireAuth'
+import RoutePreloader from './routes/RoutePreloader'
+import { HomePage, LoginPage, SettingsPage, SignupPage } from './routes/pages'
+import { useAuthStore } from './store/authStore'
+
+function PageFallback() {
+  return <p className="text-center text-gray-500 dark:text-gray-400 py-8">Loading...</p>
+}
+
+function Nav() {
+  const token = useAuthStore((state) => state.token)
+  if (!token) return null
+
   return (
-    <div className="min-h-screen bg-gray-50 dark:bg-gray-900">
-      <div className="container mx-auto px-4 py-8">
-        <header className="text-center mb-8">
-          <h1 className="text-4xl font-bold text-gray-900 dark:text-white mb-2">
-            📝 To-Do List
-          </h1>
-          <p className="text-gray-600 dark:text-gray-400">
-            Manage your tasks efficiently
-          </p>
-        </header>
+    <nav className="flex justify-center gap-4 mb-6 text-sm">
+      <Link to="/" onMouseEnter={HomePage.preload} onFocus={HomePage.preload} className="text-blue-600 hover:underline">
+        Tasks
+      </Link>
+      <Link
+        to="/settings"
+        onMouseEnter={SettingsPage.preload}
+        onFocus={SettingsPage.preload}
+        className="text-blue-600 hover:underline"
+      >
+        Settings
+      </Link>
+    </nav>
+  )
+}
 
-        <main className="max-w-4xl mx-auto">
-          <div className="bg-white dark:bg-gray-800 rounded-lg shadow-md p-6">
-            <h2 className="text-2xl font-semibold text-gray-800 dark:text-gray-100 mb-4">
-              Welcome to To-Do App! 🚀
-            </h2>
-            <p className="text-gray-600 dark:text-gray-300">
-              Frontend and Backend are successfully set up.
+function App() {
+  return (
+    <BrowserRouter>
+      <RoutePreloader />
+      <div className="min-h-screen bg-gray-50 dark:bg-gray-900">
+        <div className="container mx-auto px-4 py-8">
+          <header className="text-center mb-8">
+            <h1 className="text-4xl font-bold text-gray-900 dark:text-white mb-2">
+              📝 To-Do List
+            </h1>
+            <p className="text-gray-600 dark:text-gray-400">
+              Manage your tasks efficiently
             </p>
-            <div className="mt-4 p-4 bg-green-50 dark:bg-green-900/20 rounded border border-green-200 dark:border-green-800">
-              <p className="text-sm text-green-800 dark:text-green-300">
-                ✅ Phase 1 (SETUP-ENV-001) is in progress
-              </p>
-            </div>
-          </div>
-        </main>
+          </header>
+
+          <Nav />
+
+          <main className="max-w-4xl mx-auto">
+            <Suspense fallback={<PageFallback />}>
+              <Routes>
+                <Route path="/login" element={<LoginPage />} />
+                <Route path="/signup" element={<SignupPage />} />
+                <Route
+                  path="/"
+                  element={
+                    <RequireAuth>
+                      <HomePage />
+                    </RequireAuth>
+                  }
+                />
+                <Route
+                  path="/settings"
+                  element={
+                    <RequireAuth>
+                      <SettingsPage />
+                    </RequireAuth>
+                  }
+                />
+                <Route path="*" element={<Navigate to="/" replace />} />
+              </Routes>
+            </Suspense>
+          </main>
+        </div>
       </div>
-    </div>
+    </BrowserRouter>
   )
 }
 
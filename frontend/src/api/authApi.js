@@ -0,0 +1,11 @@
+import axiosInstance from './axiosInstance'
+
+export const login = async ({ email, password }) => {
+  const { data } = await axiosInstance.post('/api/auth/login', { email, password })
+  return data
+}
+
+export const signup = async ({ email, name, password }) => {
+  const { data } = await axiosInstance.post('/api/auth/signup', { email, name, password })
+  return data
+}
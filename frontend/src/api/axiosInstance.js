@@ -0,0 +1,19 @@
+import axios from 'axios'
+
+export const TOKEN_STORAGE_KEY = 'token'
+
+const axiosInstance = axios.create({
+  baseURL: import.meta.env.VITE_API_URL || 'http://localhost:5000',
+  timeout: 15000,
+})
+
+// Attach the stored JWT to every request
+axiosInstance.interceptors.request.use((config) => {
+  const token = localStorage.getItem(TOKEN_STORAGE_KEY)
+  if (token) {
+    config.headers.Authorization = `Bearer ${token}`
+  }
+  return config
+})
+
+export default axiosInstance
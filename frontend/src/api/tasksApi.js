@@ -0,0 +1,13 @@
+import axiosInstance from './axiosInstance'
+
+// Changes since a sync version; pass the previous page's nextCursor to continue
+export const fetchSync = async ({ since, cursor, limit } = {}) => {
+  const { data } = await axiosInstance.get('/api/sync', { params: { since, cursor, limit } })
+  return data
+}
+
+// Apply up to 1000 create/update/complete/delete/retag operations at once
+export const bulkTasks = async (operations) => {
+  const { data } = await axiosInstance.post('/api/tasks/bulk', { operations })
+  return data
+}
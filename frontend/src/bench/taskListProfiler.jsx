@@ -0,0 +1,152 @@
+// TaskList commit-time benchmark (dev only).
+//
+// Run `npm run dev` and open http://localhost:5173/bench/task-list.html
+// (append ?count=20000 to change the task count). Seeds the task store with
+// synthetic tasks, then uses <Profiler> to record React commit durations for
+// mount, single-task toggles, scrolling and incremental filtering. Store
+// updates are also timed with performance.now(), since selector work runs in
+// the store subscription, outside any React commit. Results are rendered on
+// the page and logged with console.table.
+
+import { Profiler, useEffect, useState } from 'react'
+import { createRoot } from 'react-dom/client'
+import '../index.css'
+import VisibleTaskList from '../components/task/VisibleTaskList'
+import { TASK_CARD_HEIGHT } from '../components/task/TaskCard'
+import { createVisibleIdsSelector } from '../store/taskSelectors'
+import { useTaskStore } from '../store/taskStore'
+
+const COUNT = Number(new URLSearchParams(location.search).get('count') || 10_000)
+const FRAME_BUDGET_MS = 16.7
+
+const commits = []
+const updates = []
+let scenario = 'mount'
+let setFilter = () => {}
+
+const nextFrame = () => new Promise((resolve) => requestAnimationFrame(() => setTimeout(resolve)))
+
+const seedTasks = () => {
+  const start = Date.now() - COUNT * 60_000
+  const tasksById = {}
+  for (let i = 0; i < COUNT; i += 1) {
+    const _id = i.toString(16).padStart(24, '0')
+    tasksById[_id] = {
+      _id,
+      title: `Task ${i} ${['회의록 정리', 'review PR', '장보기', 'write report'][i % 4]}`,
+      priority: ['low', 'medium', 'high'][i % 3],
+      tags: [['work', 'home', 'study'][i % 3]],
+      category: ['Work', 'Personal'][i % 2],
+      isCompleted: i % 5 === 0,
+      dueDate: i % 7 === 0 ? new Date(start + i * 3_600_000).toISOString() : undefined,
+      createdAt: new Date(start + i * 60_000).toISOString(),
+    }
+  }
+  // Seed in memory only: the benchmark never touches IndexedDB or the API
+  useTaskStore.setState({ tasksById, hydrated: true })
+}
+
+function Harness() {
+  const [filter, setHarnessFilter] = useState({ query: '', status: 'all' })
+
+  useEffect(() => {
+    setFilter = setHarnessFilter
+  }, [])
+
+  return (
+    <Profiler
+      id="TaskList"
+      onRender={(id, phase, actualDuration) => scenario && commits.push({ scenario, phase, actualDuration })}
+    >
+      <VisibleTaskList filter={filter} height={600} />
+    </Profiler>
+  )
+}
+
+const percentiles = (values) => {
+  const sorted = [...values].sort((a, b) => a - b)
+  const at = (p) => sorted[Math.min(sorted.length - 1, Math.floor(p * sorted.length))]
+  return { p50: at(0.5), p95: at(0.95), max: sorted[sorted.length - 1] }
+}
+
+const summarize = () => {
+  const rows = {}
+  for (const name of new Set([...commits, ...updates].map((entry) => entry.scenario))) {
+    const durations = commits.filter((commit) => commit.scenario === name).map((commit) => commit.actualDuration)
+    const updateTimes = updates.filter((update) => update.scenario === name).map((update) => update.duration)
+    const commit = durations.length ? percentiles(durations) : null
+    rows[name] = {
+      commits: durations.length,
+      'p50 (ms)': commit ? commit.p50.toFixed(2) : '-',
+      'p95 (ms)': commit ? commit.p95.toFixed(2) : '-',
+      'max (ms)': commit ? commit.max.toFixed(2) : '-',
+      'over 16.7ms': durations.filter((d) => d > FRAME_BUDGET_MS).length,
+      'store update p50 (ms)': updateTimes.length ? percentiles(updateTimes).p50.toFixed(2) : '-',
+    }
+  }
+  return rows
+}
+
+// Toggle tasks that are on screen, timing the store update (state change plus
+// every subscribed selector) separately from the React commits it causes
+const toggleVisible = async (name, status) => {
+  scenario = null
+  setFilter({ query: '', status })
+  await nextFrame()
+  scenario = name
+
+  const selectVisibleIds = createVisibleIdsSelector()
+  for (let i = 0; i < 50; i += 1) {
+    const rows = selectVisibleIds({ status })(useTaskStore.getState())
+    const id = rows[i % 5]
+    const started = performance.now()
+    useTaskStore.setState((state) => ({
+      tasksById: { ...state.tasksById, [id]: { ...state.tasksById[id], isCompleted: !state.tasksById[id].isCompleted } },
+    }))
+    updates.push({ scenario, duration: performance.now() - started })
+    await nextFrame()
+  }
+}
+
+const run = async () => {
+  await nextFrame()
+
+  // Under 'all' the list keeps its ids and only the toggled card re-renders;
+  // under 'active' each toggle removes a row, so the list re-renders too
+  await toggleVisible('toggle one task', 'all')
+  await toggleVisible('toggle one task (active filter)', 'active')
+  scenario = null
+  setFilter({ query: '', status: 'all' })
+  await nextFrame()
+
+  scenario = 'scroll'
+  const scroller = document.querySelector('.overflow-y-auto')
+  for (let i = 1; i <= 100; i += 1) {
+    scroller.scrollTop = i * 5 * TASK_CARD_HEIGHT
+    await nextFrame()
+  }
+
+  scenario = 'filter (typing)'
+  const query = 'task 12'
+  for (let i = 1; i <= query.length; i += 1) {
+    setFilter({ query: query.slice(0, i), status: 'all' })
+    await nextFrame()
+  }
+
+  const results = summarize()
+  console.table(results)
+  document.getElementById('results').textContent = JSON.stringify({ tasks: COUNT, results }, null, 2)
+}
+
+seedTasks()
+
+// No StrictMode: its double rendering would inflate the measured durations
+createRoot(document.getElementById('root')).render(
+  <div className="container mx-auto max-w-4xl p-4">
+    <h1 className="mb-4 text-xl font-bold">TaskList profiler: {COUNT} tasks</h1>
+    <Harness />
+    <pre id="results" className="mt-4 text-xs">Running...</pre>
+  </div>,
+)
+
+run()
@@ -0,0 +1,16 @@
+// Labeled text input; spreads react-hook-form's register() props (incl. ref)
+function Input({ label, error, id, ...props }) {
+  return (
+    <label htmlFor={id} className="block mb-4">
+      <span className="block text-sm font-medium text-gray-700 dark:text-gray-300 mb-1">{label}</span>
+      <input
+        id={id}
+        className="w-full rounded border border-gray-300 px-3 py-2 dark:border-gray-600 dark:bg-gray-700 dark:text-gray-100"
+        {...props}
+      />
+      {error && <span className="mt-1 block text-sm text-red-600 dark:text-red-400">{error}</span>}
+    </label>
+  )
+}
+
+export default Input
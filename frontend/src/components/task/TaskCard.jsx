@@ -0,0 +1,74 @@
+import { memo } from 'react'
+import { format, isPast } from 'date-fns'
+import { useTaskStore } from '../../store/taskStore'
+import { selectTask } from '../../store/taskSelectors'
+
+export const TASK_CARD_HEIGHT = 88
+
+const PRIORITY_STYLES = {
+  high: 'bg-red-100 text-red-700 dark:bg-red-900/30 dark:text-red-300',
+  medium: 'bg-yellow-100 text-yellow-700 dark:bg-yellow-900/30 dark:text-yellow-300',
+  low: 'bg-green-100 text-green-700 dark:bg-green-900/30 dark:text-green-300',
+}
+
+// Subscribes to its own task only, so edits elsewhere never re-render it
+function TaskCard({ id }) {
+  const task = useTaskStore(selectTask(id))
+  const toggleTask = useTaskStore((state) => state.toggleTask)
+  const deleteTask = useTaskStore((state) => state.deleteTask)
+
+  if (!task) return null
+
+  const dueDate = task.dueDate ? new Date(task.dueDate) : null
+  const overdue = dueDate && !task.isCompleted && isPast(dueDate)
+
+  return (
+    <div
+      className="flex h-full items-center gap-3 border-b border-gray-200 px-4 dark:border-gray-700"
+      style={{ height: TASK_CARD_HEIGHT }}
+    >
+      <input
+        type="checkbox"
+        className="h-5 w-5 shrink-0 accent-blue-600"
+        checked={task.isCompleted}
+        onChange={() => toggleTask(id)}
+        aria-label={`Mark "${task.title}" as ${task.isCompleted ? 'active' : 'completed'}`}
+      />
+
+      <div className="min-w-0 flex-1">
+        <p
+          className={`truncate font-medium ${
+            task.isCompleted ? 'text-gray-400 line-through' : 'text-gray-900 dark:text-gray-100'
+          }`}
+        >
+          {task.title}
+        </p>
+        <div className="mt-1 flex items-center gap-2 truncate text-xs text-gray-500 dark:text-gray-400">
+          <span className={`rounded px-1.5 py-0.5 ${PRIORITY_STYLES[task.priority] ?? PRIORITY_STYLES.medium}`}>
+            {task.priority}
+          </span>
+          {dueDate && (
+            <span className={overdue ? 'text-red-600 dark:text-red-400' : undefined}>
+              {format(dueDate, 'yyyy-MM-dd')}
+            </span>
+          )}
+          {task.category && <span>{task.category}</span>}
+          {task.tags?.map((tag) => (
+            <span key={tag}>#{tag}</span>
+          ))}
+        </div>
+      </div>
+
+      <button
+        type="button"
+        className="shrink-0 rounded px-2 py-1 text-sm text-gray-400 hover:bg-gray-100 hover:text-red-600 dark:hover:bg-gray-700"
+        onClick={() => deleteTask(id)}
+        aria-label={`Delete "${task.title}"`}
+      >
+        ✕
+      </button>
+    </div>
+  )
+}
+
+export default memo(TaskCard)
@@ -0,0 +1,45 @@
+import { useEffect, useState } from 'react'
+import { useDebounce } from '../../hooks/useDebounce'
+
+const STATUS_OPTIONS = [
+  { value: 'all', label: 'All' },
+  { value: 'active', label: 'Active' },
+  { value: 'completed', label: 'Completed' },
+]
+
+// Search box and status filter. Typing stays responsive because the query is
+// only reported after the user pauses.
+function TaskFilter({ onChange, delay = 200 }) {
+  const [query, setQuery] = useState('')
+  const [status, setStatus] = useState('all')
+  const debouncedQuery = useDebounce(query, delay)
+
+  useEffect(() => {
+    onChange({ query: debouncedQuery, status })
+  }, [debouncedQuery, status, onChange])
+
+  return (
+    <div className="mb-4 flex flex-col gap-2 sm:flex-row">
+      <input
+        type="search"
+        value={query}
+        onChange={(event) => setQuery(event.target.value)}
+        placeholder="Search tasks..."
+        className="flex-1 rounded border border-gray-300 px-3 py-2 dark:border-gray-600 dark:bg-gray-700 dark:text-gray-100"
+      />
+      <select
+        value={status}
+        onChange={(event) => setStatus(event.target.value)}
+        className="rounded border border-gray-300 px-3 py-2 dark:border-gray-600 dark:bg-gray-700 dark:text-gray-100"
+      >
+        {STATUS_OPTIONS.map(({ value, label }) => (
+          <option key={value} value={value}>
+            {label}
+          </option>
+        ))}
+      </select>
+    </div>
+  )
+}
+
+export default TaskFilter
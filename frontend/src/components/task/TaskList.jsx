@@ -0,0 +1,49 @@
+import { useEffect, useRef, useState } from 'react'
+import TaskCard, { TASK_CARD_HEIGHT } from './TaskCard'
+
+const OVERSCAN = 6
+
+// Windowed list: only the rows in (or just around) the viewport are mounted.
+// Scroll state is kept as the first visible row index, so scrolling within a
+// row does not re-render the list.
+function TaskList({ ids, height = 600 }) {
+  const containerRef = useRef(null)
+  const [firstRow, setFirstRow] = useState(0)
+  const [viewportHeight, setViewportHeight] = useState(height)
+
+  useEffect(() => {
+    const container = containerRef.current
+    const observer = new ResizeObserver(([entry]) => setViewportHeight(entry.contentRect.height))
+    observer.observe(container)
+    return () => observer.disconnect()
+  }, [])
+
+  const start = Math.max(0, firstRow - OVERSCAN)
+  const end = Math.min(ids.length, firstRow + Math.ceil(viewportHeight / TASK_CARD_HEIGHT) + OVERSCAN)
+
+  return (
+    <div
+      ref={containerRef}
+      className="overflow-y-auto"
+      style={{ height }}
+      onScroll={(event) => setFirstRow(Math.floor(event.currentTarget.scrollTop / TASK_CARD_HEIGHT))}
+    >
+      {!ids.length && (
+        <p className="py-12 text-center text-gray-500 dark:text-gray-400">No tasks found.</p>
+      )}
+      <div className="relative" style={{ height: ids.length * TASK_CARD_HEIGHT }}>
+        {ids.slice(start, end).map((id, i) => (
+          <div
+            key={id}
+            className="absolute inset-x-0"
+            style={{ transform: `translateY(${(start + i) * TASK_CARD_HEIGHT}px)` }}
+          >
+            <TaskCard id={id} />
+          </div>
+        ))}
+      </div>
+    </div>
+  )
+}
+
+export default TaskList
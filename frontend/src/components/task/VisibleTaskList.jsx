@@ -0,0 +1,16 @@
+import { useMemo } from 'react'
+import { useShallow } from 'zustand/react/shallow'
+import { useTaskStore } from '../../store/taskStore'
+import { createVisibleIdsSelector } from '../../store/taskSelectors'
+import TaskList from './TaskList'
+
+// Connects TaskList to the store. useShallow keeps the list from re-rendering
+// when a task changes without changing which ids are visible.
+function VisibleTaskList({ filter, height }) {
+  const selectVisibleIds = useMemo(() => createVisibleIdsSelector(), [])
+  const ids = useTaskStore(useShallow(selectVisibleIds(filter)))
+
+  return <TaskList ids={ids} height={height} />
+}
+
+export default VisibleTaskList
@@ -0,0 +1,19 @@
+import { useEffect, useState } from 'react'
+import TaskFilter from '../components/task/TaskFilter'
+import VisibleTaskList from '../components/task/VisibleTaskList'
+import { startBackgroundSync } from '../store/taskStore'
+
+function HomePage() {
+  const [filter, setFilter] = useState({ query: '', status: 'all' })
+
+  useEffect(() => startBackgroundSync(), [])
+
+  return (
+    <div className="bg-white dark:bg-gray-800 rounded-lg shadow-md p-6">
+      <TaskFilter onChange={setFilter} />
+      <VisibleTaskList filter={filter} height={600} />
+    </div>
+  )
+}
+
+export default HomePage
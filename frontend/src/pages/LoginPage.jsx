@@ -0,0 +1,68 @@
+import { useState } from 'react'
+import { useForm } from 'react-hook-form'
+import { Link, useNavigate } from 'react-router-dom'
+import Input from '../components/common/Input'
+import { HomePage, SignupPage } from '../routes/pages'
+import { useAuthStore } from '../store/authStore'
+
+function LoginPage() {
+  const login = useAuthStore((state) => state.login)
+  const navigate = useNavigate()
+  const [serverError, setServerError] = useState(null)
+  const {
+    register,
+    handleSubmit,
+    formState: { errors, isSubmitting },
+  } = useForm()
+
+  const onSubmit = async (values) => {
+    setServerError(null)
+    try {
+      await login(values)
+      navigate('/')
+    } catch (err) {
+      setServerError(err.response?.data?.error ?? 'Login failed')
+    }
+  }
+
+  return (
+    <div className="bg-white dark:bg-gray-800 rounded-lg shadow-md p-6 max-w-md mx-auto">
+      <h2 className="text-2xl font-semibold text-gray-800 dark:text-gray-100 mb-4">Log in</h2>
+      {/* Start fetching the task UI as soon as the user engages with the form */}
+      <form onSubmit={handleSubmit(onSubmit)} onFocus={HomePage.preload}>
+        <Input
+          id="email"
+          label="Email"
+          type="email"
+          autoComplete="email"
+          error={errors.email?.message}
+          {...register('email', { required: 'Email is required' })}
+        />
+        <Input
+          id="password"
+          label="Password"
+          type="password"
+          autoComplete="current-password"
+          error={errors.password?.message}
+          {...register('password', { required: 'Password is required' })}
+        />
+        {serverError && <p className="mb-4 text-sm text-red-600 dark:text-red-400">{serverError}</p>}
+        <button
+          type="submit"
+          disabled={isSubmitting}
+          className="w-full rounded bg-blue-600 px-4 py-2 font-medium text-white hover:bg-blue-700 disabled:opacity-50"
+        >
+          {isSubmitting ? 'Logging in...' : 'Log in'}
+        </button>
+      </form>
+      <p className="mt-4 text-sm text-gray-600 dark:text-gray-400">
+        No account?{' '}
+        <Link to="/signup" onMouseEnter={SignupPage.preload} className="text-blue-600 hover:underline">
+          Sign up
+        </Link>
+      </p>
+    </div>
+  )
+}
+
+export default LoginPage
@@ -0,0 +1,46 @@
+import { useNavigate } from 'react-router-dom'
+import { useAuthStore } from '../store/authStore'
+import { useTaskStore } from '../store/taskStore'
+
+function SettingsPage() {
+  const logout = useAuthStore((state) => state.logout)
+  const status = useTaskStore((state) => state.status)
+  const pendingOps = useTaskStore((state) => state.pendingOps)
+  const droppedOps = useTaskStore((state) => state.droppedOps)
+  const lastSyncedAt = useTaskStore((state) => state.lastSyncedAt)
+  const navigate = useNavigate()
+
+  return (
+    <div className="bg-white dark:bg-gray-800 rounded-lg shadow-md p-6">
+      <h2 className="text-2xl font-semibold text-gray-800 dark:text-gray-100 mb-4">Settings</h2>
+
+      <dl className="mb-6 grid grid-cols-2 gap-2 text-sm text-gray-600 dark:text-gray-300">
+        <dt>Sync status</dt>
+        <dd>{status}</dd>
+        <dt>Pending changes</dt>
+        <dd>{pendingOps}</dd>
+        {droppedOps > 0 && (
+          <>
+            <dt>Changes rejected by the server</dt>
+            <dd>{droppedOps}</dd>
+          </>
+        )}
+        <dt>Last synced</dt>
+        <dd>{lastSyncedAt ? new Date(lastSyncedAt).toLocaleString() : 'Never'}</dd>
+      </dl>
+
+      <button
+        type="button"
+        onClick={async () => {
+          await logout()
+          navigate('/login')
+        }}
+        className="rounded border border-gray-300 px-4 py-2 text-gray-700 hover:bg-gray-100 dark:border-gray-600 dark:text-gray-200 dark:hover:bg-gray-700"
+      >
+        Log out
+      </button>
+    </div>
+  )
+}
+
+export default SettingsPage
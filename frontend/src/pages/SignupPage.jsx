@@ -0,0 +1,79 @@
+import { useState } from 'react'
+import { useForm } from 'react-hook-form'
+import { Link, useNavigate } from 'react-router-dom'
+import Input from '../components/common/Input'
+import { HomePage, LoginPage } from '../routes/pages'
+import { useAuthStore } from '../store/authStore'
+
+function SignupPage() {
+  const signup = useAuthStore((state) => state.signup)
+  const navigate = useNavigate()
+  const [serverError, setServerError] = useState(null)
+  const {
+    register,
+    handleSubmit,
+    formState: { errors, isSubmitting },
+  } = useForm()
+
+  const onSubmit = async (values) => {
+    setServerError(null)
+    try {
+      await signup(values)
+      navigate('/')
+    } catch (err) {
+      setServerError(err.response?.data?.error ?? 'Sign up failed')
+    }
+  }
+
+  return (
+    <div className="bg-white dark:bg-gray-800 rounded-lg shadow-md p-6 max-w-md mx-auto">
+      <h2 className="text-2xl font-semibold text-gray-800 dark:text-gray-100 mb-4">Create account</h2>
+      <form onSubmit={handleSubmit(onSubmit)} onFocus={HomePage.preload}>
+        <Input
+          id="name"
+          label="Name"
+          autoComplete="name"
+          error={errors.name?.message}
+          {...register('name', { required: 'Name is required', maxLength: { value: 50, message: 'Max 50 characters' } })}
+        />
+        <Input
+          id="email"
+          label="Email"
+          type="email"
+          autoComplete="email"
+          error={errors.email?.message}
+          {...register('email', { required: 'Email is required' })}
+        />
+        <Input
+          id="password"
+          label="Password"
+          type="password"
+          autoComplete="new-password"
+          error={errors.password?.message}
+          {...register('password', {
+            required: 'Password is required',
+            minLength: { value: 8, message: 'At least 8 characters' },
+            // bcrypt's limit is 72 UTF-8 bytes, e.g. 24 Korean characters
+            validate: (value) => new TextEncoder().encode(value).length <= 72 || 'Password is too long',
+          })}
+        />
+        {serverError && <p className="mb-4 text-sm text-red-600 dark:text-red-400">{serverError}</p>}
+        <button
+          type="submit"
+          disabled={isSubmitting}
+          className="w-full rounded bg-blue-600 px-4 py-2 font-medium text-white hover:bg-blue-700 disabled:opacity-50"
+        >
+          {isSubmitting ? 'Creating account...' : 'Sign up'}
+        </button>
+      </form>
+      <p className="mt-4 text-sm text-gray-600 dark:text-gray-400">
+        Already have an account?{' '}
+        <Link to="/login" onMouseEnter={LoginPage.preload} className="text-blue-600 hover:underline">
+          Log in
+        </Link>
+      </p>
+    </div>
+  )
+}
+
+export default SignupPage
@@ -0,0 +1,14 @@
+import { Navigate, useLocation } from 'react-router-dom'
+import { useAuthStore } from '../store/authStore'
+
+function RequireAuth({ children }) {
+  const token = useAuthStore((state) => state.token)
+  const location = useLocation()
+
+  if (!token) {
+    return <Navigate to="/login" replace state={{ from: location }} />
+  }
+  return children
+}
+
+export default RequireAuth
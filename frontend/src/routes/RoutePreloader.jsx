@@ -0,0 +1,30 @@
+import { useEffect } from 'react'
+import { useLocation } from 'react-router-dom'
+import { NEXT_PAGE } from './pages'
+
+const whenIdle = (callback) => {
+  if ('requestIdleCallback' in window) {
+    const handle = window.requestIdleCallback(callback, { timeout: 2000 })
+    return () => window.cancelIdleCallback(handle)
+  }
+  const handle = setTimeout(callback, 200)
+  return () => clearTimeout(handle)
+}
+
+// Prefetches the chunk of the most likely next route once the current one has
+// rendered and the main thread is free, so navigation doesn't wait on the network.
+function RoutePreloader() {
+  const { pathname } = useLocation()
+
+  useEffect(() => {
+    const next = NEXT_PAGE[pathname]
+    if (!next) return undefined
+    return whenIdle(() => {
+      next.preload()
+    })
+  }, [pathname])
+
+  return null
+}
+
+export default RoutePreloader
@@ -0,0 +1,15 @@
+import { lazyWithPreload } from '../utils/lazyWithPreload'
+
+// Each page is its own chunk, so the login screen does not ship the task UI
+export const LoginPage = lazyWithPreload(() => import('../pages/LoginPage'))
+export const SignupPage = lazyWithPreload(() => import('../pages/SignupPage'))
+export const HomePage = lazyWithPreload(() => import('../pages/HomePage'))
+export const SettingsPage = lazyWithPreload(() => import('../pages/SettingsPage'))
+
+// Most likely next page from each route, fetched once the browser is idle
+export const NEXT_PAGE = {
+  '/login': HomePage,
+  '/signup': HomePage,
+  '/': SettingsPage,
+  '/settings': HomePage,
+}
@@ -0,0 +1,29 @@
+import { create } from 'zustand'
+import * as authApi from '../api/authApi'
+import { TOKEN_STORAGE_KEY } from '../api/axiosInstance'
+
+// The task store is loaded on demand so the login route does not ship it
+const loadTaskStore = () => import('./taskStore')
+
+// Tasks cached in IndexedDB belong to one account; signing in as another one
+// wipes them before the new token can sync them
+const persistSession = async (set, { user, token }) => {
+  const { claimTaskStore } = await loadTaskStore()
+  await claimTaskStore(user._id)
+  localStorage.setItem(TOKEN_STORAGE_KEY, token)
+  set({ user, token })
+}
+
+export const useAuthStore = create((set) => ({
+  token: localStorage.getItem(TOKEN_STORAGE_KEY),
+  user: null,
+
+  login: async (credentials) => persistSession(set, await authApi.login(credentials)),
+  signup: async (details) => persistSession(set, await authApi.signup(details)),
+  logout: async () => {
+    localStorage.removeItem(TOKEN_STORAGE_KEY)
+    set({ token: null, user: null })
+    const { resetTaskStore } = await loadTaskStore()
+    await resetTaskStore()
+  },
+}))
@@ -0,0 +1,87 @@
+// Selectors for useTaskStore. Components subscribe to the narrowest slice they
+// need, so an update to one task only re-renders the card showing it.
+
+export const selectTask = (id) => (state) => state.tasksById[id]
+
+const matchesStatus = (task, status) =>
+  status === 'all' || (status === 'completed' ? task.isCompleted : !task.isCompleted)
+
+const matchesQuery = (task, query) =>
+  !query ||
+  task.title.toLowerCase().includes(query) ||
+  task.description?.toLowerCase().includes(query) ||
+  task.category?.toLowerCase().includes(query) ||
+  task.tags?.some((tag) => tag.toLowerCase().includes(query))
+
+const byNewest = (a, b) => (a.createdAt < b.createdAt ? 1 : a.createdAt > b.createdAt ? -1 : 0)
+
+// Ids whose task object changed between two tasksById maps, or null when
+// tasks were added or removed or a createdAt changed (the order must be
+// rebuilt). Only compares references, so it is cheap next to filtering.
+const changedIds = (prev, next, prevCount) => {
+  const changed = []
+  let count = 0
+  for (const id in next) {
+    count += 1
+    const before = prev[id]
+    if (before === next[id]) continue
+    if (!before || before.createdAt !== next[id].createdAt) return null
+    changed.push(id)
+  }
+  return count === prevCount ? changed : null
+}
+
+// Build a memoized selector returning the ids of tasks matching the filter,
+// newest first. The newest-first order of all tasks is kept between calls and
+// only rebuilt when tasks are added, removed or re-dated:
+// - a change to some tasks re-tests just those tasks, and returns the previous
+//   array (so the list does not re-render) unless one entered or left it;
+// - a longer query (the user kept typing) narrows the previous result;
+// - any other filter change filters the kept order without sorting.
+export const createVisibleIdsSelector = () => {
+  let last = null
+
+  return ({ status = 'all', query = '' } = {}) =>
+    (state) => {
+      const { tasksById } = state
+      const normalized = query.trim().toLowerCase()
+      const matches = (id) => matchesStatus(tasksById[id], status) && matchesQuery(tasksById[id], normalized)
+      const sameFilter = last !== null && status === last.status && normalized === last.query
+      const remember = (next) => {
+        last = { tasksById, status, query: normalized, visible: null, ...next }
+        return last.ids
+      }
+
+      if (last !== null && tasksById === last.tasksById) {
+        if (sameFilter) return last.ids
+        const narrowed = status === last.status && normalized.startsWith(last.query)
+        return remember({ order: last.order, ids: (narrowed ? last.ids : last.order).filter(matches) })
+      }
+
+      const changed = last && changedIds(last.tasksById, tasksById, last.order.length)
+      if (!changed) {
+        const order = Object.values(tasksById)
+          .sort(byNewest)
+          .map((task) => task._id)
+        return remember({ order, ids: order.filter(matches) })
+      }
+      if (!sameFilter) {
+        return remember({ order: last.order, ids: last.order.filter(matches) })
+      }
+
+      const visible = last.visible ?? new Set(last.ids)
+      let moved = false
+      for (const id of changed) {
+        const isVisible = matches(id)
+        if (isVisible === visible.has(id)) continue
+        moved = true
+        if (isVisible) visible.add(id)
+        else visible.delete(id)
+      }
+      return remember({
+        order: last.order,
+        ids: moved ? last.order.filter((id) => visible.has(id)) : last.ids,
+        visible,
+      })
+    }
+}
@@ -0,0 +1,362 @@
+import { create } from 'zustand'
+import { bulkTasks, fetchSync } from '../api/tasksApi'
+import { createObjectId } from '../utils/objectId'
+import {
+  clearAll,
+  loadSnapshot,
+  readOutbox,
+  readOwner,
+  removeFromOutbox,
+  saveChanges,
+  saveOptimistic,
+} from '../utils/taskDb'
+
+// Offline-first task store.
+//
+// Tasks live in IndexedDB and are normalized by id in memory. Mutations are
+// applied optimistically, persisted together with an outbox entry, and
+// flushed to POST /api/tasks/bulk in the background. GET /api/sync then pulls
+// only what changed since the last known server version.
+
+const MAX_BULK_OPERATIONS = 1000
+// Well under the server's 12 MB bulk body limit, so one request stays small
+// enough to upload on a slow connection
+const MAX_BATCH_BYTES = 1024 * 1024
+// Server failures on the same batch before it is split to find the operation
+// responsible, which is then dropped
+const MAX_FLUSH_ATTEMPTS = 5
+const FLUSH_DELAY_MS = 300
+const BAD_REQUEST = 400
+const PAYLOAD_TOO_LARGE = 413
+// Signed out, rate limited or the server temporarily unavailable: the same
+// batch can succeed later
+const TRANSIENT_STATUSES = new Set([401, 408, 429, 502, 503, 504])
+const DAY_MS = 24 * 60 * 60 * 1000
+
+const now = () => new Date().toISOString()
+
+const withCompletion = (task, isCompleted) => ({
+  ...task,
+  isCompleted,
+  completedAt: isCompleted ? now() : undefined,
+})
+
+// Apply one bulk operation to a task (or create it); returns null when deleted
+const applyOperation = (task, operation) => {
+  switch (operation.op) {
+    case 'create':
+      return {
+        priority: 'medium',
+        tags: [],
+        isCompleted: false,
+        ...operation.task,
+        _id: operation.id,
+        createdAt: now(),
+        updatedAt: now(),
+      }
+    case 'update': {
+      const next = { ...task, ...operation.changes, updatedAt: now() }
+      return operation.changes.isCompleted === undefined ? next : withCompletion(next, operation.changes.isCompleted)
+    }
+    case 'complete':
+      return { ...withCompletion(task, operation.isCompleted), updatedAt: now() }
+    case 'retag': {
+      const { tags, addTags = [], removeTags = [], category } = operation
+      const nextTags = [...new Set([...(tags ?? task.tags ?? []), ...addTags])].filter(
+        (tag) => !removeTags.includes(tag),
+      )
+      return { ...task, tags: nextTags, ...(category !== undefined && { category }), updatedAt: now() }
+    }
+    case 'delete':
+      return null
+    default:
+      return task
+  }
+}
+
+const isNetworkError = (err) => !err.response
+const isTransient = (err) => isNetworkError(err) || TRANSIENT_STATUSES.has(err.response.status)
+
+const encoder = new TextEncoder()
+
+// Longest prefix of outbox `entries` whose operations serialize to at most
+// `maxBytes`; always at least one entry
+const takeBatch = (entries, maxBytes) => {
+  let bytes = 0
+  let count = 0
+  for (const { operation } of entries) {
+    bytes += encoder.encode(JSON.stringify(operation)).length + 1
+    if (count > 0 && bytes > maxBytes) break
+    count += 1
+  }
+  return entries.slice(0, count)
+}
+
+let flushTimer = null
+// Outbox key at the head of a batch the server keeps failing on, across syncs
+let failing = null
+let running = null
+let stopActiveSync = null
+// Bumped when the signed-in account changes; work started under an older
+// session must not write its results back
+let session = 0
+
+const INITIAL_STATE = {
+  tasksById: {},
+  version: 0,
+  lastSyncedAt: null,
+  retentionDays: null,
+  pendingOps: 0,
+  // Operations the server rejected for good and that were dropped
+  droppedOps: 0,
+  hydrated: false,
+  status: 'idle', // 'idle' | 'syncing' | 'offline' | 'error'
+}
+
+export const useTaskStore = create((set, get) => {
+  // Optimistically apply `operation`, persist it and schedule a flush
+  const mutate = async (operation) => {
+    const { tasksById } = get()
+    const current = tasksById[operation.id]
+    if (operation.op !== 'create' && !current) return
+
+    const next = applyOperation(current, operation)
+    const updated = { ...tasksById }
+    if (next) updated[operation.id] = next
+    else delete updated[operation.id]
+    set((state) => ({ tasksById: updated, pendingOps: state.pendingOps + 1 }))
+
+    await saveOptimistic({ put: next ? [next] : [], remove: next ? [] : [operation.id], operation })
+    get().scheduleSync()
+  }
+
+  // Push queued operations. Returns true when the outbox is empty afterwards.
+  const flush = async (started) => {
+    let needsFullResync = false
+    let limit = MAX_BULK_OPERATIONS
+    // Set once a batch has failed MAX_FLUSH_ATTEMPTS times: every failing
+    // batch is split right away until a single operation is left to drop
+    let isolating = false
+
+    for (;;) {
+      const batch = takeBatch(await readOutbox(limit), MAX_BATCH_BYTES)
+      if (!batch.length) break
+
+      let response
+      let dropped = false
+      try {
+        response = await bulkTasks(batch.map((entry) => entry.operation))
+        failing = null
+      } catch (err) {
+        // Offline, signed out or the server is briefly unavailable: keep the
+        // outbox and retry on the next sync
+        if (isTransient(err)) {
+          if (started === session) set({ status: isNetworkError(err) ? 'offline' : 'error' })
+          return false
+        }
+
+        const status = err.response.status
+        const rejected = status === BAD_REQUEST || status === PAYLOAD_TOO_LARGE
+        if (!rejected) {
+          // The server failed (e.g. 500). Retry on later syncs before
+          // concluding that the batch itself is the problem.
+          const head = batch[0].key
+          failing = { key: head, attempts: failing?.key === head ? failing.attempts + 1 : 1 }
+          if (!isolating && failing.attempts < MAX_FLUSH_ATTEMPTS) {
+            if (started === session) set({ status: 'error' })
+            return false
+          }
+          isolating = true
+        }
+        // Too large, invalid or failing: split so that only the operations
+        // responsible are dropped
+        if (batch.length > 1) {
+          limit = Math.ceil(batch.length / 2)
+          continue
+        }
+        // A single operation the server will never accept: drop it and
+        // rebuild from the server
+        dropped = true
+        needsFullResync = true
+        failing = null
+        isolating = false
+        limit = MAX_BULK_OPERATIONS
+      }
+
+      // Rejected operations leave optimistic state the delta feed cannot undo
+      if (response?.results.some((result) => result.status !== 'ok' && result.status !== 'exists')) {
+        needsFullResync = true
+      }
+      if (started !== session) return false
+      await removeFromOutbox(batch.map((entry) => entry.key))
+      set((state) => ({
+        pendingOps: Math.max(0, state.pendingOps - batch.length),
+        droppedOps: state.droppedOps + (dropped ? batch.length : 0),
+      }))
+    }
+
+    if (needsFullResync) {
+      set({ version: 0 })
+    }
+    return true
+  }
+
+  // Pull changes page by page. A full resync (version 0) replaces local state.
+  const pull = async (started) => {
+    const { lastSyncedAt, retentionDays } = get()
+    // Tombstones older than the retention window are gone: start over
+    const expired = lastSyncedAt && retentionDays && Date.now() - lastSyncedAt > retentionDays * DAY_MS
+    let since = expired ? 0 : get().version
+    let cursor
+    let tasksById = since === 0 ? {} : { ...get().tasksById }
+    let resetOnce = false
+    const changed = new Map()
+    const removed = new Set()
+
+    const put = (task) => {
+      tasksById[task._id] = task
+      changed.set(task._id, task)
+      removed.delete(task._id)
+    }
+    const remove = (id) => {
+      delete tasksById[id]
+      changed.delete(id)
+      removed.add(id)
+    }
+
+    for (;;) {
+      const page = await fetchSync({ since, cursor })
+      if (page.reset && !resetOnce) {
+        resetOnce = true
+        since = 0
+        cursor = undefined
+        tasksById = {}
+        changed.clear()
+        removed.clear()
+        continue
+      }
+
+      page.tasks.forEach(put)
+      page.deleted.forEach(remove)
+
+      if (page.nextCursor) {
+        cursor = page.nextCursor
+        continue
+      }
+
+      // Operations queued while pulling stay applied on top of server state
+      for (const { operation } of await readOutbox(MAX_BULK_OPERATIONS)) {
+        const current = tasksById[operation.id]
+        if (operation.op !== 'create' && !current) continue
+        const next = applyOperation(current, operation)
+        if (next) put(next)
+        else remove(operation.id)
+      }
+
+      if (started !== session) return
+      const meta = { version: page.version, lastSyncedAt: Date.now(), retentionDays: page.retentionDays }
+      await saveChanges(
+        since === 0
+          ? { clear: true, put: Object.values(tasksById), meta }
+          : { put: [...changed.values()], remove: [...removed], meta },
+      )
+      set({ tasksById, ...meta })
+      return
+    }
+  }
+
+  return {
+    ...INITIAL_STATE,
+
+    // Load the local copy so the UI renders before any network round trip
+    hydrate: async () => {
+      if (get().hydrated) return
+      const started = session
+      const { tasks, ...meta } = await loadSnapshot()
+      if (started !== session) return
+      const stored = Object.fromEntries(tasks.map((task) => [task._id, task]))
+      // Keep edits made before hydration finished
+      set((state) => ({ tasksById: { ...stored, ...state.tasksById }, ...meta, hydrated: true }))
+    },
+
+    // Flush the outbox, then pull server changes. Concurrent calls share one run.
+    sync: () => {
+      if (running) return running
+      const started = session
+      running = (async () => {
+        try {
+          await get().hydrate()
+          if (!navigator.onLine) {
+            set({ status: 'offline' })
+            return
+          }
+          set({ status: 'syncing' })
+          // Pulling with unsent local edits would overwrite them
+          if (!(await flush(started))) return
+          await pull(started)
+          if (started === session) set({ status: 'idle' })
+        } catch (err) {
+          if (started === session) set({ status: isNetworkError(err) ? 'offline' : 'error' })
+        } finally {
+          if (started === session) running = null
+        }
+      })()
+      return running
+    },
+
+    scheduleSync: () => {
+      clearTimeout(flushTimer)
+      flushTimer = setTimeout(() => get().sync(), FLUSH_DELAY_MS)
+    },
+
+    createTask: (task) => mutate({ op: 'create', id: createObjectId(), task }),
+    updateTask: (id, changes) => mutate({ op: 'update', id, changes }),
+    toggleTask: (id) => mutate({ op: 'complete', id, isCompleted: !get().tasksById[id]?.isCompleted }),
+    retagTask: (id, { tags, addTags, removeTags, category }) =>
+      mutate({ op: 'retag', id, tags, addTags, removeTags, category }),
+    deleteTask: (id) => mutate({ op: 'delete', id }),
+  }
+})
+
+// Keep the store in sync in the background: on start, when the browser comes
+// back online or the tab becomes visible, and on a fixed interval.
+export const startBackgroundSync = ({ intervalMs = 60_000 } = {}) => {
+  const { sync } = useTaskStore.getState()
+  const onVisible = () => {
+    if (document.visibilityState === 'visible') sync()
+  }
+
+  sync()
+  window.addEventListener('online', sync)
+  document.addEventListener('visibilitychange', onVisible)
+  const timer = setInterval(sync, intervalMs)
+
+  const stop = () => {
+    window.removeEventListener('online', sync)
+    document.removeEventListener('visibilitychange', onVisible)
+    clearInterval(timer)
+    if (stopActiveSync === stop) stopActiveSync = null
+  }
+  stopActiveSync = stop
+  return stop
+}
+
+// Forget the current account's tasks: stop syncing, drop in-memory state and
+// wipe IndexedDB, including operations still in the outbox
+export const resetTaskStore = async () => {
+  stopActiveSync?.()
+  clearTimeout(flushTimer)
+  session += 1
+  running = null
+  failing = null
+  useTaskStore.setState(INITIAL_STATE)
+  await clearAll()
+}
+
+// Bind the local copy to `userId`. Data left by another account (or by an
+// unknown one) is wiped, so it is neither shown nor pushed with this token.
+export const claimTaskStore = async (userId) => {
+  if ((await readOwner()) === userId) return
+  await resetTaskStore()
+  await saveChanges({ meta: { owner: userId } })
+}
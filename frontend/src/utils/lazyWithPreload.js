@@ -0,0 +1,16 @@
+import { lazy } from 'react'
+
+// React.lazy component that can also be fetched ahead of navigation via
+// `Component.preload()`. The import promise is shared, so preloading twice
+// or preloading then rendering only downloads the chunk once.
+export function lazyWithPreload(factory) {
+  let promise = null
+  const load = () => {
+    promise ??= factory()
+    return promise
+  }
+
+  const Component = lazy(load)
+  Component.preload = load
+  return Component
+}
@@ -0,0 +1,12 @@
+// MongoDB-compatible ObjectId (4-byte timestamp + 8 random bytes) so tasks
+// created offline already carry their final server id.
+export const createObjectId = () => {
+  const bytes = new Uint8Array(12)
+  crypto.getRandomValues(bytes.subarray(4))
+  const seconds = Math.floor(Date.now() / 1000)
+  bytes[0] = (seconds >>> 24) & 0xff
+  bytes[1] = (seconds >>> 16) & 0xff
+  bytes[2] = (seconds >>> 8) & 0xff
+  bytes[3] = seconds & 0xff
+  return Array.from(bytes, (b) => b.toString(16).padStart(2, '0')).join('')
+}
@@ -0,0 +1,101 @@
+// IndexedDB persistence for the task store:
+//   tasks  - task documents keyed by _id
+//   meta   - sync bookkeeping (version, lastSyncedAt, retentionDays) and the
+//            id of the account the data belongs to (owner)
+//   outbox - queued bulk operations not yet accepted by the server
+
+const DB_NAME = 'todo-app'
+const DB_VERSION = 1
+
+let dbPromise = null
+
+const promisify = (request) =>
+  new Promise((resolve, reject) => {
+    request.onsuccess = () => resolve(request.result)
+    request.onerror = () => reject(request.error)
+  })
+
+const openDb = () => {
+  dbPromise ??= new Promise((resolve, reject) => {
+    const request = indexedDB.open(DB_NAME, DB_VERSION)
+    request.onupgradeneeded = () => {
+      const db = request.result
+      db.createObjectStore('tasks', { keyPath: '_id' })
+      db.createObjectStore('meta')
+      db.createObjectStore('outbox', { autoIncrement: true })
+    }
+    request.onsuccess = () => resolve(request.result)
+    request.onerror = () => reject(request.error)
+  })
+  return dbPromise
+}
+
+// Run `work` inside one transaction and resolve once it commits
+const withStores = async (names, mode, work) => {
+  const db = await openDb()
+  const tx = db.transaction(names, mode)
+  work(...names.map((name) => tx.objectStore(name)))
+  await new Promise((resolve, reject) => {
+    tx.oncomplete = resolve
+    tx.onerror = () => reject(tx.error)
+    tx.onabort = () => reject(tx.error)
+  })
+}
+
+export const loadSnapshot = async () => {
+  const db = await openDb()
+  const tx = db.transaction(['tasks', 'meta', 'outbox'], 'readonly')
+  const [tasks, version, lastSyncedAt, retentionDays, pendingOps] = await Promise.all([
+    promisify(tx.objectStore('tasks').getAll()),
+    promisify(tx.objectStore('meta').get('version')),
+    promisify(tx.objectStore('meta').get('lastSyncedAt')),
+    promisify(tx.objectStore('meta').get('retentionDays')),
+    promisify(tx.objectStore('outbox').count()),
+  ])
+  return { tasks, version: version ?? 0, lastSyncedAt: lastSyncedAt ?? null, retentionDays, pendingOps }
+}
+
+// Write changed tasks, remove deleted ones and update meta in one transaction
+export const saveChanges = ({ put = [], remove = [], meta = {}, clear = false }) =>
+  withStores(['tasks', 'meta'], 'readwrite', (tasks, metaStore) => {
+    if (clear) tasks.clear()
+    put.forEach((task) => tasks.put(task))
+    remove.forEach((id) => tasks.delete(id))
+    Object.entries(meta).forEach(([key, value]) => metaStore.put(value, key))
+  })
+
+// Persist an optimistic change together with its outbox entry, atomically
+export const saveOptimistic = ({ put = [], remove = [], operation }) =>
+  withStores(['tasks', 'outbox'], 'readwrite', (tasks, outbox) => {
+    put.forEach((task) => tasks.put(task))
+    remove.forEach((id) => tasks.delete(id))
+    outbox.add(operation)
+  })
+
+export const readOutbox = async (limit) => {
+  const db = await openDb()
+  const store = db.transaction('outbox', 'readonly').objectStore('outbox')
+  const [keys, operations] = await Promise.all([
+    promisify(store.getAllKeys(null, limit)),
+    promisify(store.getAll(null, limit)),
+  ])
+  return keys.map((key, i) => ({ key, operation: operations[i] }))
+}
+
+export const removeFromOutbox = (keys) =>
+  withStores(['outbox'], 'readwrite', (outbox) => {
+    keys.forEach((key) => outbox.delete(key))
+  })
+
+export const readOwner = async () => {
+  const db = await openDb()
+  return promisify(db.transaction('meta', 'readonly').objectStore('meta').get('owner'))
+}
+
+// Drop every task, all sync bookkeeping and the outbox, e.g. on logout
+export const clearAll = () =>
+  withStores(['tasks', 'meta', 'outbox'], 'readwrite', (tasks, meta, outbox) => {
+    tasks.clear()
+    meta.clear()
+    outbox.clear()
+  })
@@ -1,7 +1,49 @@
+import process from 'node:process'
 import { defineConfig } from 'vite'
 import react from '@vitejs/plugin-react'
+import { bundleBudget } from './plugins/bundleBudget'
+
+// Long-lived vendor chunks stay cached across app deploys
+const VENDOR_CHUNKS = {
+  react: ['react', 'react-dom', 'react-router', 'react-router-dom', 'scheduler'],
+  'date-fns': ['date-fns'],
+  axios: ['axios'],
+}
+
+// Package name of a module id inside node_modules, e.g. `react-dom` or `@scope/pkg`
+const packageName = (id) => id.match(/node_modules\/((?:@[^/]+\/)?[^/]+)/)?.[1]
 
 // https://vite.dev/config/
 export default defineConfig({
-  plugins: [react()],
+  plugins: [
+    react(),
+    // Max gzip kB per chunk (by chunk name) or asset (`index.css`); anything
+    // else gets `defaultBudget`. `BUNDLE_BUDGET=warn npm run build` reports
+    // overruns without failing, to re-measure after a dependency upgrade.
+    bundleBudget({
+      budgets: {
+        react: 110,
+        axios: 20,
+        'date-fns': 15,
+        index: 30,
+        HomePage: 20,
+        LoginPage: 10,
+        SignupPage: 10,
+        SettingsPage: 10,
+      },
+      defaultBudget: 25,
+      failOnExceed: process.env.BUNDLE_BUDGET !== 'warn',
+    }),
+  ],
+  build: {
+    rollupOptions: {
+      output: {
+        // Only the modules the app imports land in a vendor chunk
+        manualChunks(id) {
+          const name = packageName(id)
+          return Object.keys(VENDOR_CHUNKS).find((chunk) => VENDOR_CHUNKS[chunk].includes(name))
+        },
+      },
+    },
+  },
 })